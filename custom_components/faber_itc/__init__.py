@@ -1,18 +1,104 @@
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 import logging
-from homeassistant.core import HomeAssistant
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.components.http import StaticPathConfig
-from .const import DOMAIN, CONF_HOST, DEFAULT_PORT
+from .const import (
+    DOMAIN,
+    DATA_GATE,
+    DATA_STATIC_PATH,
+    CONF_HOST,
+    CONF_DUAL_CONNECTION,
+    CONF_TEMP_DEADBAND,
+    CONF_TEMP_MIN_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_DUAL_CONNECTION,
+    DEFAULT_TEMP_DEADBAND,
+    DEFAULT_TEMP_MIN_INTERVAL,
+)
+from .admission import FaberConnectionGate
 from .client import FaberITCClient
 from .coordinator import FaberITCUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Time spent importing this package (and the modules it pulls in)
+IMPORT_DURATION = time.perf_counter() - _IMPORT_STARTED
+
+SERVICE_GET_STATISTICS = "get_statistics"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_SAMPLES = "samples"
+
+GET_STATISTICS_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+    vol.Optional(ATTR_SAMPLES, default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+})
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up Faber ITC from a config entry."""
     _LOGGER.debug("Setting up integration for host: %s", entry.data.get(CONF_HOST))
+    timings = {"module_import": IMPORT_DURATION}
+
+    started = time.perf_counter()
+    await _async_register_static_path(hass)
+    timings["static_path"] = time.perf_counter() - started
+
+    host = entry.data[CONF_HOST]
+    client = FaberITCClient(
+        host,
+        DEFAULT_PORT,
+        dual_connection=entry.options.get(CONF_DUAL_CONNECTION, DEFAULT_DUAL_CONNECTION),
+        # Shared by all entries so restarts and outages do not reconnect all at once
+        gate=hass.data.setdefault(DATA_GATE, FaberConnectionGate()),
+    )
+    coordinator = FaberITCUpdateCoordinator(
+        hass,
+        client,
+        temp_deadband=entry.options.get(CONF_TEMP_DEADBAND, DEFAULT_TEMP_DEADBAND),
+        temp_min_interval=entry.options.get(CONF_TEMP_MIN_INTERVAL, DEFAULT_TEMP_MIN_INTERVAL),
+    )
+    
+    started = time.perf_counter()
+    await coordinator.async_config_entry_first_refresh()
+    timings["first_refresh"] = time.perf_counter() - started
     
-    # Register 'branding' folder for entity icons
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+    
+    started = time.perf_counter()
+    await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "switch"])
+    timings["platform_forward"] = time.perf_counter() - started
+
+    # The connect phases (tcp_connect, identify, ...) are timed by the client
+    coordinator.setup_timings = timings
+    _LOGGER.debug(
+        "Setup timings for %s: %s",
+        host,
+        ", ".join(f"{phase}={duration * 1000:.1f}ms" for phase, duration in timings.items()),
+    )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_STATISTICS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_STATISTICS,
+            _async_get_statistics,
+            schema=GET_STATISTICS_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    return True
+
+async def _async_register_static_path(hass: HomeAssistant):
+    """Register the 'branding' folder for entity icons once per Home Assistant run."""
+    if hass.data.get(DATA_STATIC_PATH):
+        return
+    # Imported here, the http component is heavy and only needed once
+    from homeassistant.components.http import StaticPathConfig
+
     await hass.http.async_register_static_paths(
         [
             StaticPathConfig(
@@ -22,18 +108,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             )
         ]
     )
-    
-    host = entry.data[CONF_HOST]
-    client = FaberITCClient(host, DEFAULT_PORT)
-    coordinator = FaberITCUpdateCoordinator(hass, client)
-    
-    await coordinator.async_config_entry_first_refresh()
-    
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-    
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "switch"])
-    return True
+    hass.data[DATA_STATIC_PATH] = True
+
+async def _async_get_statistics(call: ServiceCall):
+    """Return telemetry statistics (and optionally recent samples) per fireplace."""
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    limit = call.data[ATTR_SAMPLES]
+    result = {}
+    for coord_entry_id, coordinator in call.hass.data.get(DOMAIN, {}).items():
+        if entry_id and coord_entry_id != entry_id:
+            continue
+        history = coordinator.client.history
+        stats = history.statistics()
+        if limit:
+            stats["recent_samples"] = history.samples(limit)
+        result[coord_entry_id] = stats
+    return result
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
@@ -41,4 +135,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     if unload_ok:
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
         await coordinator.client.disconnect()
+        hass.data[DATA_GATE].forget(coordinator.client)
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_GET_STATISTICS)
     return unload_ok
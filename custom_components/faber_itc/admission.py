@@ -0,0 +1,112 @@
+import asyncio
+import contextlib
+import heapq
+import logging
+import random
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_CONCURRENT_CONNECTS = 2
+CONNECT_SPREAD = 2.0
+
+class FaberConnectionGate:
+    """Integration-wide admission control for connects and handshakes.
+
+    At most `limit` clients connect or handshake at the same time. When the
+    gate is busy, clients wait a random delay of up to `spread` seconds and
+    are then admitted by priority (lower value first). The gate also measures
+    how long the whole fleet of registered clients needs to get back online:
+    an outage starts when the first of them goes offline and ends when all
+    of them are online again.
+    """
+
+    def __init__(self, limit=MAX_CONCURRENT_CONNECTS, spread=CONNECT_SPREAD):
+        self._limit = limit
+        self._spread = spread
+        self._active = 0
+        self._queue = []
+        self._seq = 0
+        self._registered = set()
+        self._offline = {}
+        self._outage_started = None
+        self._outage_size = 0
+        self.last_time_to_online = None
+
+    @contextlib.asynccontextmanager
+    async def admit(self, priority=0.0):
+        """Hold an admission slot for the duration of the block."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _free(self):
+        return self._active < self._limit and not self._queue
+
+    async def _acquire(self, priority):
+        if self._free():
+            self._active += 1
+            return
+
+        # Spread contended connects so they do not all fire in the same tick
+        await asyncio.sleep(random.uniform(0, self._spread))
+        if self._free():
+            self._active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, self._seq, future))
+        self._seq += 1
+        try:
+            # The slot is handed over by _release()
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self):
+        self._active -= 1
+        while self._queue:
+            _, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                self._active += 1
+                future.set_result(None)
+                break
+
+    def register(self, key):
+        """Track a client for the time-to-online measurement, it starts offline."""
+        self._registered.add(key)
+        self.mark_offline(key)
+
+    def mark_offline(self, key):
+        """Note that a client lost its connection or is trying to (re)connect."""
+        if key not in self._registered or key in self._offline:
+            return
+        now = asyncio.get_running_loop().time()
+        if not self._offline:
+            self._outage_started = now
+            self._outage_size = 0
+        self._offline[key] = now
+        self._outage_size += 1
+
+    def mark_online(self, key):
+        """Note that a client finished its handshake."""
+        if self._offline.pop(key, None) is None:
+            return
+        if not self._offline and self._outage_started is not None:
+            now = asyncio.get_running_loop().time()
+            self.last_time_to_online = round(now - self._outage_started, 2)
+            _LOGGER.debug(
+                "All %d controllers online after %ss",
+                self._outage_size, self.last_time_to_online,
+            )
+            self._outage_started = None
+
+    def forget(self, key):
+        """Stop tracking a client that is being unloaded."""
+        self._registered.discard(key)
+        self._offline.pop(key, None)
+        if not self._offline:
+            self._outage_started = None
@@ -1,7 +1,11 @@
 import asyncio
+import contextlib
 import logging
+import random
+from collections import deque
 import struct
 import re
+import time
 from .const import (
     DEFAULT_PORT,
     MAGIC_START,
@@ -10,94 +14,303 @@ from .const import (
     SENDER_ID,
     OP_IDENTIFY,
     OP_INFO_410,
+    OP_INFO_420,
     OP_INFO_1010,
     OP_STATUS,
     OP_CONTROL,
     OP_HEARTBEAT,
+    PARAM_POWER_OFF,
+    PARAM_IGNITION_1,
+    PARAM_IGNITION_2,
+    PARAM_WIDTH_NARROW,
+    PARAM_WIDTH_WIDE,
+    PARAM_FLAME_HEIGHT,
+    STATE_OFF,
+    STATE_ON,
+    STATE_IGNITING,
+    STATE_SHUTTING_DOWN,
+    STATE_NAMES,
+    WIDTH_WIDE,
+)
+from .history import FaberTelemetryHistory
+from .models import FaberDeviceInfo, FaberStatus
+from .protocol import (
+    CONTROL,
+    FRAME_MIN_SIZE,
+    PAYLOAD_DATA_OFFSET,
+    PAYLOAD_LENGTH_OFFSET,
+    TELEMETRY,
+    split_frames,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 TCP_TIMEOUT = 10.0
 WATCHDOG_TIMEOUT = 120.0
+COMMAND_TIMEOUT = 5.0
+IGNITION_TIMEOUT = 120.0
+SHUTDOWN_TIMEOUT = 60.0
+IGNITION_START_TIMEOUT = 15.0
+STATUS_POLL_INTERVAL = 0.5
+SET_STATE_RETRIES = 3
+CONTROL_CONNECT_TIMEOUT = 3.0
+PROBE_TIMEOUT = 1.5
+HANDSHAKE_TIMEOUT = 2.0
+CONTROL_RETRY_INTERVAL = 300.0
+UNKNOWN_FRAME_LOG = 32
+# Resynced garbage produces arbitrary opcodes, only count this many
+MAX_UNKNOWN_OPCODES = 64
+COMMAND_BUFFER_TIMEOUT = 30.0
+COMMAND_SPACING = 0.1
+# Idle time after which a pending frame ending in MAGIC_END is delivered
+FRAME_IDLE_TIMEOUT = 0.5
+
+# Setting each control parameter belongs to, keys the command buffer
+_COMMAND_GROUPS = {
+    PARAM_POWER_OFF: "power",
+    PARAM_IGNITION_1: "power",
+    PARAM_IGNITION_2: "power",
+    PARAM_WIDTH_NARROW: "width",
+    PARAM_WIDTH_WIDE: "width",
+    PARAM_FLAME_HEIGHT: "flame",
+}
+
+# Connect phases that end with the first reply of an opcode
+_REPLY_PHASES = {
+    OP_IDENTIFY: "identify",
+    OP_INFO_1010: "info_fetch",
+    OP_STATUS: "first_status",
+}
 
 class FaberITCClient:
-    def __init__(self, host, port=DEFAULT_PORT):
+    __slots__ = (
+        "host",
+        "port",
+        "dual_connection",
+        "_gate",
+        "last_used",
+        "_lock",
+        "_control_lock",
+        "_reconcile_tasks",
+        "_reader",
+        "_writer",
+        "_read_task",
+        "_control_channel_lock",
+        "_control_writer",
+        "_control_read_task",
+        "_control_retry_at",
+        "_subscribers",
+        "unknown_opcodes",
+        "unknown_frames",
+        "malformed_frames",
+        "skipped_bytes",
+        "timings",
+        "_pending_phases",
+        "_last_data_time",
+        "_reconnect_delay",
+        "_reconnect_at",
+        "_state_waiters",
+        "_reply_events",
+        "_pending_commands",
+        "_flush_task",
+        "_ignition_started",
+        "ignition_duration",
+        "history",
+        "device_info",
+        "last_status",
+    )
+
+    def __init__(self, host, port=DEFAULT_PORT, dual_connection=False, gate=None):
         self.host = host
         self.port = port
+        self.dual_connection = dual_connection
+        self._gate = gate
+        if gate:
+            gate.register(self)
+        self.last_used = 0
         self._lock = asyncio.Lock()
+        self._control_lock = asyncio.Lock()
+        # Running set_state calls -> the command groups they change
+        self._reconcile_tasks = {}
         self._reader = None
         self._writer = None
         self._read_task = None
-        self._callback = None
+        # Optional second connection used only for control commands
+        self._control_channel_lock = asyncio.Lock()
+        self._control_writer = None
+        self._control_read_task = None
+        self._control_retry_at = 0
+        self._subscribers = {}
+        self.unknown_opcodes = {}
+        # Created on the first unknown frame
+        self.unknown_frames = None
+        self.malformed_frames = 0
+        self.skipped_bytes = 0
+        # Duration of the latest connect phases in seconds, see _start_phase
+        self.timings = {}
+        self._pending_phases = {}
         self._last_data_time = 0
         self._reconnect_delay = 1
-        self.device_info = {
-            "model": "Faber ITC Fireplace",
-            "manufacturer": "Faber",
-            "serial": None,
-            "article": None,
-            "variant": None,
-            "installer_name": None,
-            "installer_phone": None,
-            "installer_web": None,
-            "installer_mail": None,
-        }
-        self.last_status = {
-            "state": 0,
-            "flame_height": 0,
-            "flame_width": 0,
-            "temp": 0.0,
-        }
-
-    def set_callback(self, callback):
-        """Set callback for status updates."""
-        self._callback = callback
-
-    async def connect(self):
+        self._reconnect_at = 0
+        self._state_waiters = []
+        self._reply_events = {}
+        # group -> (commands, future), control commands issued while disconnected
+        self._pending_commands = {}
+        self._flush_task = None
+        self._ignition_started = None
+        self.ignition_duration = None
+        self.history = FaberTelemetryHistory()
+        self.device_info = FaberDeviceInfo()
+        self.last_status = FaberStatus()
+
+    @property
+    def connected(self):
+        """Return True if the main connection is open."""
+        return self._writer is not None
+
+    @property
+    def control_connected(self):
+        """Return True if the dedicated control connection is open."""
+        return self._control_writer is not None
+
+    def subscribe(self, opcode, handler):
+        """Call handler(message) for every frame with the given base opcode.
+
+        For known opcodes the message is the decoded state (last_status for
+        0x1030, device_info for info frames), shared rather than copied, so
+        handlers must not modify it. Other opcodes deliver the raw payload.
+        Returns a function that removes the subscription.
+        """
+        handlers = self._subscribers.setdefault(opcode, [])
+        handlers.append(handler)
+
+        def unsubscribe():
+            if handler in handlers:
+                handlers.remove(handler)
+
+        return unsubscribe
+
+    async def connect(self, timeout=TCP_TIMEOUT):
         """Establish connection."""
         async with self._lock:
             if self._writer:
                 return True
             
+            if self._gate:
+                self._gate.mark_offline(self)
             try:
-                _LOGGER.debug("Connecting to %s:%s", self.host, self.port)
-                self._reader, self._writer = await asyncio.wait_for(
-                    asyncio.open_connection(self.host, self.port), timeout=TCP_TIMEOUT
-                )
-                
-                await self._send_frame(OP_IDENTIFY, b"\x00" * 9)
-
-                if self._read_task:
-                    self._read_task.cancel()
-                self._read_task = asyncio.create_task(self._read_loop())
-                self._last_data_time = asyncio.get_running_loop().time()
+                async with self._admit():
+                    _LOGGER.debug("Connecting to %s:%s", self.host, self.port)
+                    self._start_phase("tcp_connect")
+                    self._start_phase("first_status")
+                    self._reader, self._writer = await asyncio.wait_for(
+                        asyncio.open_connection(self.host, self.port), timeout=timeout
+                    )
+                    self._end_phase("tcp_connect")
+
+                    self._expect_reply(OP_IDENTIFY)
+                    self._start_phase("identify")
+                    await self._send_frame(OP_IDENTIFY, b"\x00" * 9)
+
+                    if self._read_task:
+                        self._read_task.cancel()
+                    self._read_task = asyncio.create_task(
+                        self._read_loop(self._reader, self.disconnect)
+                    )
+                    self._last_data_time = asyncio.get_running_loop().time()
+
+                    # Keep the admission slot until the handshake is answered
+                    if self._gate:
+                        await self._wait_reply(OP_IDENTIFY, HANDSHAKE_TIMEOUT)
                 
                 _LOGGER.debug("Connected to %s:%s", self.host, self.port)
-                return True
+                if self._gate:
+                    self._gate.mark_online(self)
             except Exception as e:
                 _LOGGER.debug("Connection failed: %s", e)
-                await self.disconnect()
+                self._pending_phases.clear()
+                await self._close_main()
                 return False
 
+        if self.dual_connection:
+            self._control_retry_at = 0
+            await self._open_control()
+        return True
+
+    def _admit(self):
+        """Return the admission context for connects and handshakes.
+
+        Recently used fireplaces get a higher priority.
+        """
+        if not self._gate:
+            return contextlib.nullcontext()
+        return self._gate.admit(priority=-self.last_used)
+
+    async def _open_control(self):
+        """Open the dedicated control connection, fall back to the main one on failure."""
+        async with self._control_channel_lock:
+            if self._control_writer or not self._writer:
+                return
+            writer = None
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port),
+                    timeout=CONTROL_CONNECT_TIMEOUT,
+                )
+                await self._send_frame(OP_IDENTIFY, b"\x00" * 9, writer)
+                self._control_writer = writer
+                self._control_read_task = asyncio.create_task(
+                    self._read_loop(reader, self._close_control)
+                )
+                _LOGGER.debug("Control connection to %s:%s established", self.host, self.port)
+            except Exception as e:
+                _LOGGER.debug(
+                    "Control connection failed (%s), using single connection mode", e
+                )
+                if writer:
+                    writer.close()
+                self._control_retry_at = (
+                    asyncio.get_running_loop().time() + CONTROL_RETRY_INTERVAL
+                )
+
+    async def _close_control(self):
+        """Close the dedicated control connection."""
+        if self._control_read_task:
+            self._control_read_task.cancel()
+            self._control_read_task = None
+        writer, self._control_writer = self._control_writer, None
+        if writer:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except:
+                pass
+
     async def disconnect(self):
         """Close connection."""
         async with self._lock:
-            if self._read_task:
-                self._read_task.cancel()
-                self._read_task = None
-            if self._writer:
-                try:
-                    self._writer.close()
-                    await self._writer.wait_closed()
-                except:
-                    pass
-                finally:
-                    self._writer = None
-            self._reader = None
-
-    async def _send_frame(self, opcode: int, payload: bytes):
-        """Build and send a protocol frame."""
+            await self._close_main()
+        await self._close_control()
+
+    async def _close_main(self):
+        """Close the main (telemetry) connection."""
+        if self._read_task:
+            self._read_task.cancel()
+            self._read_task = None
+        if self._writer:
+            try:
+                self._writer.close()
+                await self._writer.wait_closed()
+            except:
+                pass
+            finally:
+                self._writer = None
+            if self._gate:
+                self._gate.mark_offline(self)
+        self._reader = None
+
+    async def _send_frame(self, opcode: int, payload: bytes, writer=None):
+        """Build and send a protocol frame (on the main connection by default)."""
         frame = (
             MAGIC_START
             + PROTO_HEADER
@@ -106,59 +319,67 @@ class FaberITCClient:
             + payload
             + MAGIC_END
         )
-        if self._writer:
-            self._writer.write(frame)
-            await self._writer.drain()
+        writer = writer or self._writer
+        if writer:
+            writer.write(frame)
+            await writer.drain()
             _LOGGER.debug("Sent Opcode 0x%08X, Payload: %s", opcode, payload.hex())
 
-    async def _read_loop(self):
-        """Background loop to process incoming frames."""
+    async def _read_loop(self, reader, on_close):
+        """Background loop to process incoming frames of one connection."""
         buffer = b""
         try:
             while True:
-                chunk = await self._reader.read(4096)
+                if buffer.endswith(MAGIC_END):
+                    try:
+                        chunk = await asyncio.wait_for(reader.read(4096), FRAME_IDLE_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        # A frame whose length byte overstates its data
+                        frames, buffer, _ = split_frames(buffer, flush=True)
+                        for frame in frames:
+                            self._handle_frame(frame)
+                        continue
+                else:
+                    chunk = await reader.read(4096)
                 if not chunk:
                     _LOGGER.debug("Connection closed by device")
                     break
 
-                self._last_data_time = asyncio.get_running_loop().time()
-                buffer += chunk
-
-                while True:
-                    start_idx = buffer.find(MAGIC_START)
-                    if start_idx == -1:
-                        buffer = buffer[-3:]
-                        break
-
-                    end_idx = buffer.find(MAGIC_END, start_idx)
-                    if end_idx == -1:
-                        break
-
-                    frame = buffer[start_idx : end_idx + 4]
-                    buffer = buffer[end_idx + 4:]
+                # Only the main connection feeds the watchdog
+                if reader is self._reader:
+                    self._last_data_time = asyncio.get_running_loop().time()
+                frames, buffer, skipped = split_frames(buffer + chunk)
+                if skipped:
+                    self.skipped_bytes += skipped
+                    _LOGGER.debug("Skipped %d bytes while looking for a frame", skipped)
+                for frame in frames:
                     self._handle_frame(frame)
-                    
+
         except asyncio.CancelledError:
-            pass
+            # Cancelled by the owner, which already tears the connection down
+            return
         except Exception as e:
             _LOGGER.error("Read loop error: %s", e)
-        finally:
-            asyncio.create_task(self.disconnect())
+        asyncio.create_task(on_close())
 
     def _handle_frame(self, data: bytes):
         """Parse received frames."""
-        if len(data) < 20:
+        if len(data) < FRAME_MIN_SIZE:
+            self.malformed_frames += 1
+            _LOGGER.debug("Dropping short frame: %s", data.hex())
             return
 
         opcode_raw = struct.unpack(">I", data[12:16])[0]
         opcode_base = opcode_raw & 0x0FFFFFFF
         payload = data[16:-4]
 
-        if len(payload) < 9:
+        if len(payload) < PAYLOAD_DATA_OFFSET:
+            self.malformed_frames += 1
+            _LOGGER.debug("Dropping frame with short payload: %s", data.hex())
             return
             
-        expected_len = payload[8]
-        actual_len = len(payload) - 9
+        expected_len = payload[PAYLOAD_LENGTH_OFFSET]
+        actual_len = len(payload) - PAYLOAD_DATA_OFFSET
         
         if expected_len != actual_len:
             _LOGGER.debug(
@@ -166,37 +387,131 @@ class FaberITCClient:
                 opcode_raw, expected_len, actual_len
             )
 
-        if opcode_base == OP_STATUS:
-            if len(payload) >= 22:
-                data_part = payload[9:]
-                state = data_part[2]
-                flame = data_part[6]
-                width = data_part[7]
-                
-                # Temperature is a 16-bit Big Endian value at offset 11 & 12
-                # According to user: data_part[11] and [12] combined
-                temp_raw = struct.unpack(">H", data_part[11:13])[0]
-                
-                self.last_status.update({
-                    "state": state,
-                    "flame_height": flame,
-                    "flame_width": width,
-                    "temp": temp_raw / 10.0,
-                })
-                
-                _LOGGER.debug("Parsed Status: %s", self.last_status)
-                if self._callback:
-                    self._callback(dict(self.last_status))
+        handler = self._HANDLERS.get(opcode_base)
+        if handler:
+            message = handler(self, opcode_base, payload)
+        else:
+            count = self.unknown_opcodes.get(opcode_raw)
+            if count is not None or len(self.unknown_opcodes) < MAX_UNKNOWN_OPCODES:
+                self.unknown_opcodes[opcode_raw] = (count or 0) + 1
+            if self.unknown_frames is None:
+                self.unknown_frames = deque(maxlen=UNKNOWN_FRAME_LOG)
+            self.unknown_frames.append((opcode_raw, payload))
+            _LOGGER.debug("Unhandled Opcode 0x%08X, Payload: %s", opcode_raw, payload.hex())
+            message = payload
+
+        if message is not None:
+            for subscriber in self._subscribers.get(opcode_base, ()):
+                try:
+                    subscriber(message)
+                except Exception:
+                    _LOGGER.exception("Error in subscriber for Opcode 0x%04X", opcode_base)
+
+        event = self._reply_events.get(opcode_base)
+        if event:
+            event.set()
+
+        if opcode_base == OP_IDENTIFY and self._pending_commands:
+            # The handshake was answered, the device accepts commands again
+            self._schedule_flush()
+
+        if self._pending_phases:
+            phase = _REPLY_PHASES.get(opcode_base)
+            if phase:
+                self._end_phase(phase)
+
+    def _start_phase(self, phase):
+        """Start timing a connect phase, it ends with _end_phase or its reply."""
+        self._pending_phases[phase] = time.perf_counter()
+
+    def _end_phase(self, phase):
+        started = self._pending_phases.pop(phase, None)
+        if started is not None:
+            self.timings[phase] = time.perf_counter() - started
+            _LOGGER.debug("%s: %s took %.1fms", self.host, phase, self.timings[phase] * 1000)
+
+    def _handle_ack(self, opcode_base, payload):
+        """Pass through replies that carry no decoded state (control, heartbeat, 0x0420)."""
+        return payload
+
+    def _handle_status(self, opcode_base, payload):
+        """Decode a telemetry (0x1030) frame into last_status."""
+        if len(payload) < PAYLOAD_DATA_OFFSET + TELEMETRY.size:
+            return None
+
+        # Field offsets come from the shared protocol schema
+        state, flame, width, temp_raw = TELEMETRY.decode(payload, PAYLOAD_DATA_OFFSET)
+
+        self._track_transition(self.last_status["state"], state)
+        self.last_status.update({
+            "state": state,
+            "flame_height": flame,
+            "flame_width": width,
+            "temp": temp_raw / 10.0,
+        })
+        self.history.record(state, flame, width, temp_raw / 10.0)
         
-        elif opcode_base in [OP_IDENTIFY, OP_INFO_410, OP_INFO_1010]:
-            self._parse_ascii_info(opcode_base, payload)
+        _LOGGER.debug("Parsed Status: %s", self.last_status)
+        self._resolve_waiters()
+        return self.last_status
+
+    def _expect_reply(self, opcode_base):
+        """Arm the reply event for an opcode before its request is sent."""
+        event = self._reply_events.setdefault(opcode_base, asyncio.Event())
+        event.clear()
+        return event
+
+    async def _wait_reply(self, opcode_base, timeout):
+        """Wait for the reply to a previously armed opcode."""
+        event = self._reply_events[opcode_base]
+        if event.is_set():
+            return True
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _track_transition(self, old_state, new_state):
+        """Record ignition start and duration from state transitions."""
+        if old_state == new_state:
+            return
+        now = asyncio.get_running_loop().time()
+        if new_state == STATE_IGNITING:
+            if self._ignition_started is None:
+                self._ignition_started = now
+        elif new_state == STATE_ON:
+            if self._ignition_started is not None:
+                self.ignition_duration = round(now - self._ignition_started, 1)
+                self.history.record_ignition(self.ignition_duration)
+                _LOGGER.info("Ignition finished after %ss", self.ignition_duration)
+            self._ignition_started = None
+        else:
+            if old_state == STATE_IGNITING:
+                self.history.record_ignition(None)
+            self._ignition_started = None
+
+    def _resolve_waiters(self):
+        """Resolve state waiters whose predicate matches the latest status."""
+        for waiter in list(self._state_waiters):
+            predicate, future = waiter
+            if not future.done() and predicate(self.last_status):
+                future.set_result(True)
+                self._state_waiters.remove(waiter)
+
+    async def wait_for_state(self, state, timeout=IGNITION_TIMEOUT):
+        """Wait until the device reports the given state (e.g. STATE_ON).
+
+        Returns True as soon as a matching status frame arrives, False on timeout.
+        """
+        return await self._wait_for_status(lambda s: s["state"] == state, timeout)
 
     def _parse_ascii_info(self, opcode_base, payload):
         """Extract device metadata from payload (null-terminated strings)."""
         _LOGGER.debug("Parsing Info for Opcode 0x%04X, Payload: %s", opcode_base, payload.hex())
         
         if len(payload) < 9:
-            return
+            return None
 
         # According to dissector and protocol: 
         # Payload = Reserved (8 bytes) + Length Byte (1 byte) + Data
@@ -222,7 +537,7 @@ class FaberITCClient:
         _LOGGER.debug("Extracted strings for Opcode 0x%04X: %s", opcode_base, strings)
 
         if not strings:
-            return
+            return None
 
         # Based on faber_itc_protocol.md Section 7:
         if opcode_base == OP_INFO_1010:
@@ -242,22 +557,138 @@ class FaberITCClient:
             if len(strings) >= 4: self.device_info["installer_mail"] = strings[3]
             _LOGGER.info("Installer Info Updated: Name=%s", self.device_info["installer_name"])
 
+        return self.device_info
+
+    # Decoders keyed by base opcode, they return the message for subscribers
+    _HANDLERS = {
+        OP_STATUS: _handle_status,
+        OP_IDENTIFY: _parse_ascii_info,
+        OP_INFO_410: _parse_ascii_info,
+        OP_INFO_1010: _parse_ascii_info,
+        # Content of 0x0420 is not decoded yet, pass the payload through
+        OP_INFO_420: _handle_ack,
+        OP_CONTROL: _handle_ack,
+        OP_HEARTBEAT: _handle_ack,
+    }
+
     async def _send_control(self, param_id: int, value: int):
-        """Helper to send control commands."""
-        payload = (
-            b"\xFF\xFF"
-            + struct.pack(">H", param_id)
-            + b"\x00\x00\x00"
-            + struct.pack("<H", value)
-        )
+        """Send a control command, buffering it while disconnected.
+
+        Returns False if the command expired or was superseded before the
+        connection came back.
+        """
+        return await self._send_controls(((param_id, value),))
+
+    async def _send_controls(self, commands):
+        """Send a sequence of (param_id, value) control commands."""
+        self.last_used = asyncio.get_running_loop().time()
+        if not self._writer:
+            return await self._buffer_commands(commands)
+        await self._write_controls(commands)
+        return True
+
+    async def _buffer_commands(self, commands):
+        """Keep commands until the connection is back, see _flush_commands.
+
+        Waits until the commands were sent, at most COMMAND_BUFFER_TIMEOUT.
+        set_state cancels a superseded call, which drops its entry here.
+        """
+        group = _COMMAND_GROUPS.get(commands[0][0], commands[0][0])
+        future = asyncio.get_running_loop().create_future()
+        entry = (commands, future)
+        self._pending_commands[group] = entry
+        _LOGGER.debug("Not connected, buffering %s command", group)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), COMMAND_BUFFER_TIMEOUT)
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "%s command for %s expired, not sent within %ss",
+                group, self.host, COMMAND_BUFFER_TIMEOUT,
+            )
+            return False
+        finally:
+            if self._pending_commands.get(group) is entry:
+                del self._pending_commands[group]
+
+    def _schedule_flush(self):
+        """Start sending the buffered commands unless that is already running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_commands())
+
+    async def _flush_commands(self):
+        """Send buffered commands in order.
+
+        Started by the identify reply after a reconnect, and by fetch_data
+        for commands left on a live connection.
+        """
+        while self._pending_commands and self._writer:
+            group = next(iter(self._pending_commands))
+            commands, future = self._pending_commands.pop(group)
+            if future.done():
+                continue
+            _LOGGER.debug("Sending buffered %s command", group)
+            try:
+                await self._write_controls(commands)
+            except Exception as e:
+                _LOGGER.debug("Sending buffered %s command failed: %s", group, e)
+                future.set_result(False)
+                continue
+            future.set_result(True)
+
+    async def _write_controls(self, commands):
+        """Write control commands, spaced like the app does."""
+        for index, (param_id, value) in enumerate(commands):
+            if index:
+                await asyncio.sleep(COMMAND_SPACING)
+            if param_id == PARAM_IGNITION_1:
+                self._ignition_started = asyncio.get_running_loop().time()
+            await self._write_control(param_id, value)
+
+    async def _write_control(self, param_id, value):
+        """Write one control command, preferring the control connection."""
+        payload = CONTROL.encode(param_id, value)
+        if self._control_writer:
+            try:
+                await self._send_frame(OP_CONTROL, payload, self._control_writer)
+                return
+            except Exception as e:
+                _LOGGER.debug("Control connection lost (%s), falling back to main connection", e)
+                await self._close_control()
         await self._send_frame(OP_CONTROL, payload)
 
     async def request_info(self):
         """Request device and installer info."""
+        if not self._writer:
+            # Nothing would be sent, do not hold an admission slot for it
+            return
         _LOGGER.debug("Requesting Device and Installer Info")
-        await self._send_frame(OP_INFO_1010, b"\x00" * 9)
-        await asyncio.sleep(0.2)
-        await self._send_frame(OP_INFO_410, b"\x00" * 9)
+        async with self._admit():
+            self._start_phase("info_fetch")
+            await self._send_frame(OP_INFO_1010, b"\x00" * 9)
+            await asyncio.sleep(0.2)
+            await self._send_frame(OP_INFO_410, b"\x00" * 9)
+
+    async def probe(self, timeout=PROBE_TIMEOUT):
+        """Check that the device answers identify and device info requests.
+
+        Connects, waits for both replies within timeout and disconnects again.
+        Returns True if the device identified itself in time; device_info
+        holds whatever model information arrived before the deadline.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            if not await self.connect(timeout=timeout):
+                return False
+            if not await self._wait_reply(OP_IDENTIFY, deadline - loop.time()):
+                _LOGGER.debug("No identify reply from %s within %ss", self.host, timeout)
+                return False
+            self._expect_reply(OP_INFO_1010)
+            await self._send_frame(OP_INFO_1010, b"\x00" * 9)
+            await self._wait_reply(OP_INFO_1010, deadline - loop.time())
+            return True
+        finally:
+            await self.disconnect()
 
     async def update(self):
         """Poll for status and send heartbeat."""
@@ -266,35 +697,190 @@ class FaberITCClient:
         await self._send_frame(OP_HEARTBEAT, b"\x00" * 9)
 
     async def turn_on(self):
-        """Send ignition sequence."""
-        _LOGGER.info("Sending Turn On sequence")
-        await self._send_control(0x0002, 0)
-        await asyncio.sleep(0.1)
-        await self._send_control(0x0020, 0)
-        await asyncio.sleep(0.1)
-        await self.update()
+        """Ignite the fireplace, see set_state."""
+        return await self.set_state(power=True)
 
     async def turn_off(self):
-        """Send power off command."""
-        _LOGGER.info("Sending Turn Off command")
-        await self._send_control(0x0001, 0)
-        await asyncio.sleep(0.1)
-        await self.update()
+        """Switch the fireplace off, see set_state."""
+        return await self.set_state(power=False)
 
     async def set_flame_height(self, level: int):
-        """Set flame level (0x00, 0x19, 0x32, 0x4B, 0x64)."""
-        _LOGGER.info("Setting flame level to %s", hex(level))
-        await self._send_control(0x0009, level)
-        await asyncio.sleep(0.1)
-        await self.update()
+        """Set flame level (0x00, 0x19, 0x32, 0x4B, 0x64), see set_state."""
+        return await self.set_state(flame_level=level)
 
     async def set_flame_width(self, wide: bool):
-        """Toggle flame width. 0x0006 for wide, 0x0005 for narrow."""
-        _LOGGER.info("Setting flame width to %s", "wide" if wide else "narrow")
-        param_id = 0x0006 if wide else 0x0005
-        await self._send_control(param_id, 0)
-        await asyncio.sleep(0.1)
-        await self.update()
+        """Set the wide (True) or narrow burner, see set_state."""
+        return await self.set_state(width=wide)
+
+    async def _send_ignition(self):
+        """Send both parts of the ignition sequence.
+
+        Returns False if it expired or was superseded while disconnected.
+        """
+        if not await self._send_controls(((PARAM_IGNITION_1, 0), (PARAM_IGNITION_2, 0))):
+            return False
+        await asyncio.sleep(COMMAND_SPACING)
+        return True
+
+    async def _wait_for_status(self, predicate, timeout):
+        """Wait until predicate(last_status) holds, polling status meanwhile.
+
+        The waiter is resolved from _handle_frame, the polls only make sure the
+        device keeps sending status frames while we wait.
+        """
+        if predicate(self.last_status):
+            return True
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (predicate, future)
+        self._state_waiters.append(waiter)
+        deadline = loop.time() + timeout
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                await self._send_frame(OP_STATUS, b"\x00" * 9)
+                try:
+                    return await asyncio.wait_for(
+                        asyncio.shield(future), min(STATUS_POLL_INTERVAL, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            if waiter in self._state_waiters:
+                self._state_waiters.remove(waiter)
+
+    async def set_state(self, power=None, flame_level=None, width=None):
+        """Drive the fireplace to a target state with as few commands as possible.
+
+        power is a bool, flame_level a raw flame height (0x00..0x64) and width
+        True for the wide burner. Arguments left as None are not touched.
+        Commands are only sent for values that differ from the latest
+        telemetry, flame settings are applied after ignition has finished and
+        each step is retried until the reported state matches.
+        Returns True once the device reports the requested state.
+
+        A newer call replaces running calls that only change settings it
+        changes as well, and a power off replaces every running call. Replaced
+        calls return False, so a power off is sent right away instead of
+        waiting for an ignition to finish, and a command buffered while
+        disconnected is dropped in favour of the newer one.
+        """
+        groups = set()
+        if power is not None:
+            groups.add("power")
+        if width is not None:
+            groups.add("width")
+        if flame_level is not None:
+            groups.add("flame")
+        for task, task_groups in list(self._reconcile_tasks.items()):
+            if power is False or task_groups <= groups:
+                task.cancel()
+
+        task = asyncio.create_task(self._set_state(power, flame_level, width))
+        self._reconcile_tasks[task] = groups
+        task.add_done_callback(lambda done: self._reconcile_tasks.pop(done, None))
+        try:
+            await asyncio.wait((task,))
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if task.cancelled():
+            _LOGGER.info("State change for %s was replaced by a newer one", self.host)
+            return False
+        return task.result()
+
+    async def _set_state(self, power, flame_level, width):
+        async with self._control_lock:
+            if power is False:
+                return await self._reconcile_power_off()
+
+            if power:
+                if not await self._reconcile_power_on():
+                    return False
+
+            if width is not None:
+                is_wide = lambda s: (s["flame_width"] >= WIDTH_WIDE) == width
+                param_id = PARAM_WIDTH_WIDE if width else PARAM_WIDTH_NARROW
+                if not await self._reconcile(param_id, 0, is_wide):
+                    return False
+
+            if flame_level is not None:
+                is_level = lambda s: s["flame_height"] == flame_level
+                if not await self._reconcile(PARAM_FLAME_HEIGHT, flame_level, is_level):
+                    return False
+
+            return True
+
+    async def _reconcile(self, param_id, value, predicate):
+        """Send a control command until the reported status satisfies predicate."""
+        for attempt in range(SET_STATE_RETRIES):
+            if predicate(self.last_status):
+                return True
+            _LOGGER.debug(
+                "Sending param 0x%04X value 0x%02X (attempt %d)", param_id, value, attempt + 1
+            )
+            if not await self._send_control(param_id, value):
+                return False
+            if await self._wait_for_status(predicate, COMMAND_TIMEOUT):
+                return True
+        _LOGGER.warning("Param 0x%04X was not confirmed by the device", param_id)
+        return False
+
+    async def _reconcile_power_on(self):
+        """Ignite if needed and wait until the device reports ON.
+
+        The ignition sequence is only repeated while the device never left
+        OFF. Once it reported IGNITING, any state other than ON afterwards is
+        a failed ignition and ends the call without igniting again.
+        """
+        if self.last_status["state"] == STATE_SHUTTING_DOWN:
+            # Let a running shutdown finish before igniting
+            if not await self._wait_for_status(
+                lambda s: s["state"] == STATE_OFF, SHUTDOWN_TIMEOUT
+            ):
+                return False
+
+        for attempt in range(SET_STATE_RETRIES):
+            state = self.last_status["state"]
+            if state == STATE_ON:
+                return True
+            if state != STATE_IGNITING:
+                _LOGGER.info("Sending Turn On sequence (attempt %d)", attempt + 1)
+                if not await self._send_ignition():
+                    return False
+                if not await self._wait_for_status(
+                    lambda s: s["state"] != STATE_OFF, IGNITION_START_TIMEOUT
+                ):
+                    # The device did not react at all, safe to try again
+                    continue
+            await self._wait_for_status(lambda s: s["state"] != STATE_IGNITING, IGNITION_TIMEOUT)
+            if self.last_status["state"] == STATE_ON:
+                return True
+            _LOGGER.warning(
+                "Ignition failed, fireplace reports %s",
+                STATE_NAMES.get(self.last_status["state"], self.last_status["state"]),
+            )
+            return False
+        _LOGGER.warning("Fireplace did not react to the ignition sequence")
+        return False
+
+    async def _reconcile_power_off(self):
+        """Send power off if needed and wait until the device reports OFF."""
+        is_off = lambda s: s["state"] == STATE_OFF
+        for attempt in range(SET_STATE_RETRIES):
+            state = self.last_status["state"]
+            if state == STATE_OFF:
+                return True
+            if state != STATE_SHUTTING_DOWN:
+                _LOGGER.info("Sending Turn Off command (attempt %d)", attempt + 1)
+                if not await self._send_control(PARAM_POWER_OFF, 0):
+                    return False
+            if await self._wait_for_status(is_off, SHUTDOWN_TIMEOUT):
+                return True
+        _LOGGER.warning("Fireplace did not finish shutdown")
+        return False
 
     async def fetch_data(self):
         """Watchdog check and return latest cached status."""
@@ -303,13 +889,25 @@ class FaberITCClient:
             _LOGGER.debug("Watchdog: No data for %ss, reconnecting", WATCHDOG_TIMEOUT)
             await self.disconnect()
 
-        if not self._writer:
-            try:
-                await self.connect()
+        if not self._writer and now >= self._reconnect_at:
+            if await self.connect():
                 self._reconnect_delay = 1
-            except Exception as e:
-                _LOGGER.debug("Reconnect failed: %s, retrying later", e)
-                await asyncio.sleep(self._reconnect_delay)
+            else:
+                # Exponential backoff with jitter so clients do not retry in lockstep
+                delay = self._reconnect_delay * random.uniform(0.5, 1.5)
+                _LOGGER.debug("Reconnect failed, retrying in %.1fs", delay)
+                self._reconnect_at = asyncio.get_running_loop().time() + delay
                 self._reconnect_delay = min(self._reconnect_delay * 2, 60)
 
+        if (
+            self.dual_connection
+            and self._writer
+            and not self._control_writer
+            and now >= self._control_retry_at
+        ):
+            await self._open_control()
+
+        if self._writer and self._pending_commands:
+            self._schedule_flush()
+
         return self.last_status
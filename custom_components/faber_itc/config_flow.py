@@ -1,14 +1,47 @@
+import asyncio
 import voluptuous as vol
 from homeassistant import config_entries
-from .const import DOMAIN, CONF_HOST, CONF_NAME, CONF_SENDER_ID, DEFAULT_PORT
+from homeassistant.core import callback
+from .const import (
+    DOMAIN,
+    CONF_HOST,
+    CONF_NAME,
+    CONF_SENDER_ID,
+    CONF_DUAL_CONNECTION,
+    CONF_TEMP_DEADBAND,
+    CONF_TEMP_MIN_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_DUAL_CONNECTION,
+    DEFAULT_TEMP_DEADBAND,
+    DEFAULT_TEMP_MIN_INTERVAL,
+    DISCOVERY_TIMEOUT,
+    DISCOVERY_IDLE_TIMEOUT,
+)
 from .client import FaberITCClient
 from .discovery import async_discover_devices
+from .models import DEFAULT_MODEL
+
+async def async_probe_device(host):
+    """Probe a controller and return its model name, or None if unreachable."""
+    client = FaberITCClient(host, DEFAULT_PORT)
+    try:
+        if not await client.probe():
+            return None
+    except Exception:
+        return None
+    return client.device_info.get("model") or DEFAULT_MODEL
 
 class FaberITCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow."""
+        return FaberITCOptionsFlow()
+
     def __init__(self):
-        self._discovered_devices = {} # ip -> {name, sender_id}
+        self._discovered_devices = {} # ip -> {name, sender_id, model, reachable}
         self._discovered_host = None
         self._discovered_name = None
         self._discovered_sender_id = None
@@ -23,7 +56,8 @@ class FaberITCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # This is called when the progress task is done
             return self.async_show_progress_done(next_step_id="discovery_result")
 
-        # Perform discovery (35s timeout because devices broadcast every 30s)
+        # Perform discovery (35s window because devices broadcast every 30s),
+        # collecting every controller that answers within the window
         return self.async_show_progress(
             step_id="discovery",
             progress_action="discovery_action",
@@ -42,9 +76,17 @@ class FaberITCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return ip not in current_hosts
 
         self._discovered_devices = await async_discover_devices(
-            timeout=35.0, 
-            is_new_device=is_new_device
+            timeout=DISCOVERY_TIMEOUT,
+            is_new_device=is_new_device,
+            idle_timeout=DISCOVERY_IDLE_TIMEOUT,
         )
+
+        # Probe all discovered controllers in parallel for model and reachability
+        hosts = list(self._discovered_devices)
+        models = await asyncio.gather(*(async_probe_device(host) for host in hosts))
+        for host, model in zip(hosts, models):
+            self._discovered_devices[host]["model"] = model
+            self._discovered_devices[host]["reachable"] = model is not None
         
         self.hass.async_create_task(
             self.hass.config_entries.flow.async_configure(
@@ -70,6 +112,21 @@ class FaberITCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._discovered_host = host
             self._discovered_name = name
             self._discovered_sender_id = sender_id
+
+            # Offer the other controllers found in the same scan as discovered flows
+            for other_host, other in self._discovered_devices.items():
+                if other_host != host and other.get("sender_id"):
+                    self.hass.async_create_task(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+                            data={
+                                CONF_HOST: other_host,
+                                CONF_NAME: other.get("name"),
+                                CONF_SENDER_ID: other["sender_id"],
+                            },
+                        )
+                    )
             
             # Directly try to setup with the discovered host, skipping the manual setup form
             return await self.async_step_setup({
@@ -81,9 +138,16 @@ class FaberITCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not self._discovered_devices:
             return await self.async_step_setup()
 
-        device_options = {
-            ip: f"ITC Controller ({ip})" for ip in self._discovered_devices
-        }
+        device_options = {}
+        for ip, device in self._discovered_devices.items():
+            label = device.get("model")
+            if not label or label == DEFAULT_MODEL:
+                label = device.get("name") or "ITC Controller"
+            if device.get("reachable") is False:
+                label = f"{label} ({ip}, unreachable)"
+            else:
+                label = f"{label} ({ip})"
+            device_options[ip] = label
         device_options["manual"] = "Enter IP address"
 
         return self.async_show_form(
@@ -93,6 +157,36 @@ class FaberITCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             })
         )
 
+    async def async_step_integration_discovery(self, discovery_info):
+        """Handle a controller found by a scan started from another flow."""
+        await self.async_set_unique_id(discovery_info[CONF_SENDER_ID])
+        self._abort_if_unique_id_configured()
+
+        self._discovered_host = discovery_info[CONF_HOST]
+        self._discovered_name = discovery_info.get(CONF_NAME)
+        self._discovered_sender_id = discovery_info[CONF_SENDER_ID]
+        self.context["title_placeholders"] = {
+            "name": self._discovered_name or self._discovered_host
+        }
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(self, user_input=None):
+        """Confirm setup of a discovered controller."""
+        if user_input is not None:
+            return await self.async_step_setup({
+                CONF_HOST: self._discovered_host,
+                CONF_NAME: self._discovered_name,
+                CONF_SENDER_ID: self._discovered_sender_id,
+            })
+
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders={
+                "name": self._discovered_name or "ITC Controller",
+                "host": self._discovered_host,
+            },
+        )
+
     async def async_step_setup(self, user_input=None):
         errors = {}
         
@@ -112,16 +206,15 @@ class FaberITCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._abort_if_unique_id_configured()
 
             try:
-                client = FaberITCClient(host, DEFAULT_PORT)
-                if await client.connect():
-                    # Request more info to be sure about the model
-                    await client.request_info()
-                    
+                # Reuse the probe result from discovery if we have one
+                model = self._discovered_devices.get(host, {}).get("model")
+                if not model:
+                    model = await async_probe_device(host)
+
+                if model:
                     # Fallback to model name if still no name
                     if not name:
-                        name = client.device_info.get("model", "Faber Fireplace")
-                    
-                    await client.disconnect()
+                        name = model
                     
                     return self.async_create_entry(
                         title=f"ITC Controller ({host})", 
@@ -148,3 +241,30 @@ class FaberITCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }),
             errors=errors,
         )
+
+class FaberITCOptionsFlow(config_entries.OptionsFlow):
+    """Handle Faber ITC options."""
+
+    async def async_step_init(self, user_input=None):
+        """Manage connection and temperature reporting options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_TEMP_DEADBAND,
+                    default=options.get(CONF_TEMP_DEADBAND, DEFAULT_TEMP_DEADBAND),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+                vol.Required(
+                    CONF_TEMP_MIN_INTERVAL,
+                    default=options.get(CONF_TEMP_MIN_INTERVAL, DEFAULT_TEMP_MIN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=900)),
+                vol.Required(
+                    CONF_DUAL_CONNECTION,
+                    default=options.get(CONF_DUAL_CONNECTION, DEFAULT_DUAL_CONNECTION),
+                ): bool,
+            }),
+        )
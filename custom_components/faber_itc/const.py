@@ -1,9 +1,23 @@
 DOMAIN = "faber_itc"
+DATA_GATE = "faber_itc_gate"
+DATA_STATIC_PATH = "faber_itc_static_path"
 DEFAULT_PORT = 58779
 UDP_PORT = 59779
+# Controllers broadcast every 30s, so a scan window slightly longer hears each one
+DISCOVERY_TIMEOUT = 35.0
+# Stop once no new controller appeared for a full broadcast period
+DISCOVERY_IDLE_TIMEOUT = 31.0
 CONF_HOST = "host"
 CONF_NAME = "name"
 CONF_SENDER_ID = "sender_id"
+CONF_DUAL_CONNECTION = "dual_connection"
+CONF_TEMP_DEADBAND = "temp_deadband"
+CONF_TEMP_MIN_INTERVAL = "temp_min_interval"
+
+DEFAULT_DUAL_CONNECTION = False
+DEFAULT_TEMP_DEADBAND = 0.2
+DEFAULT_TEMP_MIN_INTERVAL = 60
+TEMP_MAX_INTERVAL = 900
 
 # Protocol Markers
 MAGIC_START = b"\xA1\xA2\xA3\xA4"
@@ -22,12 +36,27 @@ OP_STATUS = 0x1030
 OP_CONTROL = 0x1040
 OP_HEARTBEAT = 0x1080
 
+# Control Parameters (0x1040)
+PARAM_POWER_OFF = 0x0001
+PARAM_IGNITION_1 = 0x0002
+PARAM_IGNITION_2 = 0x0020
+PARAM_WIDTH_NARROW = 0x0005
+PARAM_WIDTH_WIDE = 0x0006
+PARAM_FLAME_HEIGHT = 0x0009
+
 # Device States
 STATE_OFF = 0x00
 STATE_ON = 0x01
 STATE_IGNITING = 0x04
 STATE_SHUTTING_DOWN = 0x05
 
+STATE_NAMES = {
+    STATE_OFF: "off",
+    STATE_ON: "on",
+    STATE_IGNITING: "igniting",
+    STATE_SHUTTING_DOWN: "shutting_down",
+}
+
 # Burner Width
 WIDTH_NARROW = 0x32
 WIDTH_WIDE = 0x64
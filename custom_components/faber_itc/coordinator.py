@@ -4,14 +4,26 @@ import logging
 from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import OP_STATUS, DEFAULT_TEMP_DEADBAND, DEFAULT_TEMP_MIN_INTERVAL, TEMP_MAX_INTERVAL
+
 _LOGGER = logging.getLogger(__name__)
 
 class FaberITCUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Faber ITC data."""
 
-    def __init__(self, hass, client):
+    def __init__(
+        self,
+        hass,
+        client,
+        temp_deadband=DEFAULT_TEMP_DEADBAND,
+        temp_min_interval=DEFAULT_TEMP_MIN_INTERVAL,
+    ):
         """Initialize."""
         self.client = client
+        self._temp_deadband = temp_deadband
+        self._temp_min_interval = temp_min_interval
+        self._published_temp = None
+        self._published_temp_time = 0
         super().__init__(
             hass,
             _LOGGER,
@@ -19,20 +31,48 @@ class FaberITCUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=10),
         )
         self._initial_info_fetched = False
+        # Duration of the setup phases in seconds, filled by async_setup_entry
+        self.setup_timings = {}
         
-        # Register callback for event-driven updates from the client's read loop
-        self.client.set_callback(self._handle_client_update)
+        # Subscribe to status frames for event-driven updates from the client's read loop
+        self.client.subscribe(OP_STATUS, self._handle_client_update)
 
     @callback
     def _handle_client_update(self, data):
         """Handle status update from client read loop."""
-        self.async_set_updated_data(data)
+        # The client shares its status record, keep our own snapshot
+        data = self._filter_temperature(data.copy())
+        # Skip listener updates (and state writes) if nothing visible changed
+        if data != self.data:
+            self.async_set_updated_data(data)
+
+    def _filter_temperature(self, data):
+        """Hold back temperature changes inside the deadband or min interval.
+
+        The real value is always published after TEMP_MAX_INTERVAL seconds.
+        data must be a snapshot owned by the coordinator, it is modified in place.
+        """
+        temp = data.get("temp")
+        if temp is None:
+            return data
+
+        now = self.hass.loop.time()
+        if self._published_temp is not None:
+            elapsed = now - self._published_temp_time
+            in_deadband = abs(temp - self._published_temp) < self._temp_deadband
+            if elapsed < TEMP_MAX_INTERVAL and (in_deadband or elapsed < self._temp_min_interval):
+                data["temp"] = self._published_temp
+                return data
+
+        self._published_temp = temp
+        self._published_temp_time = now
+        return data
 
     @callback
     def async_set_expected_state(self, updates: dict):
         """Optimistically update the coordinator data."""
         if self.data:
-            new_data = dict(self.data)
+            new_data = self.data.copy()
             new_data.update(updates)
             self.async_set_updated_data(new_data)
 
@@ -49,6 +89,6 @@ class FaberITCUpdateCoordinator(DataUpdateCoordinator):
             data = await self.client.fetch_data()
             if data is None:
                 return {}
-            return data
+            return self._filter_temperature(data.copy())
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}")
@@ -0,0 +1,49 @@
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, DATA_GATE, CONF_HOST, CONF_SENDER_ID
+
+TO_REDACT = {
+    CONF_HOST,
+    CONF_SENDER_ID,
+    "serial",
+    "installer_name",
+    "installer_phone",
+    "installer_web",
+    "installer_mail",
+}
+
+def _ms(timings):
+    return {phase: round(duration * 1000, 1) for phase, duration in timings.items()}
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+    gate = hass.data.get(DATA_GATE)
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "device_info": async_redact_data(client.device_info.as_dict(), TO_REDACT),
+        "status": client.last_status.as_dict(),
+        "connection": {
+            "connected": client.connected,
+            "dual_connection": client.dual_connection,
+            "control_connected": client.control_connected,
+            "malformed_frames": client.malformed_frames,
+            "skipped_bytes": client.skipped_bytes,
+            "unknown_opcodes": {
+                f"0x{opcode:08X}": count for opcode, count in client.unknown_opcodes.items()
+            },
+            "fleet_time_to_online": gate.last_time_to_online if gate else None,
+        },
+        "timings_ms": {
+            "setup": _ms(coordinator.setup_timings),
+            "connect": _ms(client.timings),
+        },
+        "statistics": client.history.statistics(),
+    }
@@ -2,18 +2,23 @@ import asyncio
 import logging
 import socket
 from .const import UDP_PORT, UDP_MAGIC_START, UDP_MAGIC_END
+from .protocol import DISCOVERY
 
 _LOGGER = logging.getLogger(__name__)
 
+# A sequence this far behind the last one comes from a rebooted controller
+SEQUENCE_RESTART_GAP = 16
+
 class FaberITCDiscoveryProtocol(asyncio.DatagramProtocol):
     def __init__(self, on_discovery, discovery_event):
         self.on_discovery = on_discovery
         self.discovery_event = discovery_event
 
     def datagram_received(self, data, addr):
-        _LOGGER.debug("Received UDP packet from %s: %s", addr, data.hex())
-        
-        if len(data) < 48:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received UDP packet from %s: %s", addr, data.hex())
+
+        if len(data) < DISCOVERY.size:
             _LOGGER.debug("Packet too short: %d bytes", len(data))
             return
 
@@ -21,10 +26,9 @@ class FaberITCDiscoveryProtocol(asyncio.DatagramProtocol):
             _LOGGER.debug("Magic bytes mismatch")
             return
 
-        sender_id_hex = data[8:12].hex()
-        ip_bytes = data[12:16] # This is the controller IP inside the payload
-        # seq = data[16:20]
-        name_bytes = data[20:44]
+        # ip_bytes is the controller IP inside the payload
+        sender_id, ip_bytes, sequence, name_bytes = DISCOVERY.decode(data)
+        sender_id_hex = sender_id.hex()
         
         try:
             # Parse IP from payload
@@ -42,27 +46,56 @@ class FaberITCDiscoveryProtocol(asyncio.DatagramProtocol):
             host = controller_ip if controller_ip else addr[0]
             
             _LOGGER.debug("Discovered device '%s' with IP %s (ID: %s)", device_name, host, sender_id_hex)
-            if self.on_discovery(host, device_name, sender_id_hex):
+            if self.on_discovery(host, device_name, sender_id_hex, sequence):
                 self.discovery_event.set()
         except Exception as e:
             _LOGGER.error("Error decoding discovery packet: %s", e)
 
-async def async_discover_devices(timeout=5.0, is_new_device=None):
-    """Scan for Faber ITC devices via UDP broadcast."""
-    discovered = {} # ip -> {name, sender_id}
+async def async_discover_devices(timeout=5.0, is_new_device=None, expected_count=None, idle_timeout=None):
+    """Scan for Faber ITC devices via UDP broadcast.
+
+    Collects every device heard during the window, deduplicated by sender ID.
+    The scan ends early once expected_count devices were found, or when no new
+    device showed up for idle_timeout seconds after the first one.
+    """
+    discovered = {} # ip -> {name, sender_id, sequence, last_seen}
+    hosts_by_sender = {} # sender_id -> ip
     discovery_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def on_discovery(ip, name, sender_id, sequence):
+        known_ip = hosts_by_sender.get(sender_id)
+        if known_ip is not None:
+            device = discovered[known_ip]
+            # The sequence keeps running on the device, so older packets are
+            # stale copies. A new IP or a large jump back means it restarted.
+            restarted = device["sequence"] - sequence > SEQUENCE_RESTART_GAP
+            if known_ip == ip and sequence <= device["sequence"] and not restarted:
+                return False
+            if known_ip != ip:
+                _LOGGER.debug("Faber ITC %s moved from %s to %s", sender_id, known_ip, ip)
+                discovered[ip] = discovered.pop(known_ip)
+                hosts_by_sender[sender_id] = ip
+            device = discovered[ip]
+            device["name"] = name
+            device["sequence"] = sequence
+            device["last_seen"] = loop.time()
+            return False
 
-    def on_discovery(ip, name, sender_id):
         if ip not in discovered:
             _LOGGER.debug("Discovered Faber ITC: %s at %s (ID: %s)", name, ip, sender_id)
-            # If it's a new device (or no filter provided), signal to stop discovery
+            # Only count new devices (or all if no filter provided)
             if is_new_device is None or is_new_device(ip, sender_id):
-                discovered[ip] = {"name": name, "sender_id": sender_id}
+                discovered[ip] = {
+                    "name": name,
+                    "sender_id": sender_id,
+                    "sequence": sequence,
+                    "last_seen": loop.time(),
+                }
+                hosts_by_sender[sender_id] = ip
                 return True
         return False
 
-    loop = asyncio.get_running_loop()
-    
     # Use a custom socket to allow broadcast listening if needed, 
     # though standard binding to 0.0.0.0:UDP_PORT usually suffices for received broadcasts
     transport, _ = await loop.create_datagram_endpoint(
@@ -70,13 +103,29 @@ async def async_discover_devices(timeout=5.0, is_new_device=None):
         local_addr=("0.0.0.0", UDP_PORT)
     )
 
+    deadline = loop.time() + timeout
     try:
-        # Wait for the first new device to be found or timeout
-        try:
-            await asyncio.wait_for(discovery_event.wait(), timeout=timeout)
-            _LOGGER.debug("Discovery stopped early after finding a new device")
-        except asyncio.TimeoutError:
-            _LOGGER.debug("Discovery timed out after %s seconds", timeout)
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                _LOGGER.debug("Discovery window of %s seconds finished", timeout)
+                break
+
+            idle = discovered and idle_timeout is not None and idle_timeout < remaining
+            discovery_event.clear()
+            try:
+                await asyncio.wait_for(
+                    discovery_event.wait(), idle_timeout if idle else remaining
+                )
+            except asyncio.TimeoutError:
+                if idle:
+                    _LOGGER.debug("Discovery stopped, no new device for %s seconds", idle_timeout)
+                    break
+                continue
+
+            if expected_count is not None and len(discovered) >= expected_count:
+                _LOGGER.debug("Discovery stopped early after finding %d devices", len(discovered))
+                break
     finally:
         transport.close()
 
@@ -0,0 +1,162 @@
+import logging
+import time
+from array import array
+
+from .const import (
+    INTENSITY_LEVELS,
+    PRESET_NARROW,
+    PRESET_WIDE,
+    STATE_ON,
+    WIDTH_WIDE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+HISTORY_SIZE = 4096
+# Samples further apart than this (e.g. while disconnected) do not count as burn time
+MAX_SAMPLE_GAP = 120.0
+
+def flame_level(flame_height):
+    """Return the flame level (0-4) closest to a raw flame height."""
+    return min(INTENSITY_LEVELS, key=lambda lvl: abs(flame_height - INTENSITY_LEVELS[lvl]))
+
+class FaberTelemetryHistory:
+    """Bounded telemetry history with running burn time and ignition statistics.
+
+    Samples are kept in a ring buffer of array-backed columns, so memory use
+    is bounded no matter how long the integration runs. The columns grow with
+    the samples until the buffer is full.
+    """
+
+    __slots__ = (
+        "_size",
+        "_count",
+        "_next",
+        "_timestamps",
+        "_states",
+        "_flame_heights",
+        "_flame_widths",
+        "_temps",
+        "burn_seconds_by_level",
+        "burn_seconds_by_width",
+        "ignition_successes",
+        "ignition_failures",
+        "_ignition_seconds",
+    )
+
+    def __init__(self, size=HISTORY_SIZE):
+        self._size = size
+        self._count = 0
+        self._next = 0
+        self._timestamps = array("d")
+        self._states = array("B")
+        self._flame_heights = array("B")
+        self._flame_widths = array("B")
+        self._temps = array("h")
+
+        self.burn_seconds_by_level = [0.0] * len(INTENSITY_LEVELS)
+        self.burn_seconds_by_width = {PRESET_NARROW: 0.0, PRESET_WIDE: 0.0}
+        self.ignition_successes = 0
+        self.ignition_failures = 0
+        self._ignition_seconds = 0.0
+
+    def __len__(self):
+        return self._count
+
+    def record(self, state, flame_height, flame_width, temp, timestamp=None):
+        """Store a status sample and update the burn time aggregates."""
+        if timestamp is None:
+            timestamp = time.time()
+
+        if self._count:
+            last = (self._next - 1) % self._size
+            elapsed = timestamp - self._timestamps[last]
+            if self._states[last] == STATE_ON and 0 < elapsed <= MAX_SAMPLE_GAP:
+                self.burn_seconds_by_level[flame_level(self._flame_heights[last])] += elapsed
+                width = PRESET_WIDE if self._flame_widths[last] >= WIDTH_WIDE else PRESET_NARROW
+                self.burn_seconds_by_width[width] += elapsed
+
+        sample = (
+            timestamp,
+            state & 0xFF,
+            flame_height & 0xFF,
+            flame_width & 0xFF,
+            max(-32768, min(32767, round(temp * 10))),
+        )
+        columns = (
+            self._timestamps,
+            self._states,
+            self._flame_heights,
+            self._flame_widths,
+            self._temps,
+        )
+        idx = self._next
+        if self._count < self._size:
+            for column, value in zip(columns, sample):
+                column.append(value)
+            self._count += 1
+        else:
+            for column, value in zip(columns, sample):
+                column[idx] = value
+        self._next = (idx + 1) % self._size
+
+    def record_ignition(self, duration):
+        """Record the outcome of an ignition, duration None means it failed."""
+        if duration is None:
+            self.ignition_failures += 1
+            _LOGGER.debug("Ignition failed")
+        else:
+            self.ignition_successes += 1
+            self._ignition_seconds += duration
+
+    @property
+    def burn_hours(self):
+        """Return the total burn time in hours."""
+        return sum(self.burn_seconds_by_level) / 3600
+
+    @property
+    def ignition_count(self):
+        """Return the number of finished ignition attempts."""
+        return self.ignition_successes + self.ignition_failures
+
+    @property
+    def average_ignition_time(self):
+        """Return the average duration of successful ignitions in seconds."""
+        if not self.ignition_successes:
+            return None
+        return round(self._ignition_seconds / self.ignition_successes, 1)
+
+    def samples(self, limit=None):
+        """Return the stored samples, oldest first."""
+        count = self._count if limit is None else min(limit, self._count)
+        start = (self._next - count) % self._size
+        out = []
+        for i in range(count):
+            idx = (start + i) % self._size
+            out.append({
+                "timestamp": self._timestamps[idx],
+                "state": self._states[idx],
+                "flame_height": self._flame_heights[idx],
+                "flame_width": self._flame_widths[idx],
+                "temp": self._temps[idx] / 10.0,
+            })
+        return out
+
+    def statistics(self):
+        """Return the running aggregates."""
+        return {
+            "burn_hours": round(self.burn_hours, 3),
+            "burn_hours_by_level": {
+                f"level_{lvl}": round(seconds / 3600, 3)
+                for lvl, seconds in enumerate(self.burn_seconds_by_level)
+            },
+            "burn_hours_by_width": {
+                width: round(seconds / 3600, 3)
+                for width, seconds in self.burn_seconds_by_width.items()
+            },
+            "ignition_count": self.ignition_count,
+            "ignition_successes": self.ignition_successes,
+            "ignition_failures": self.ignition_failures,
+            "average_ignition_time": self.average_ignition_time,
+            "samples": self._count,
+        }
@@ -0,0 +1,87 @@
+DEFAULT_MODEL = "Faber ITC Fireplace"
+DEFAULT_MANUFACTURER = "Faber"
+
+class _SlotRecord:
+    """Slot-based record with the small dict-like API the entities rely on.
+
+    Instances have no per-object __dict__, which keeps the footprint of a
+    large number of clients low.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __eq__(self, other):
+        if isinstance(other, _SlotRecord):
+            return type(self) is type(other) and self.as_dict() == other.as_dict()
+        if isinstance(other, dict):
+            return self.as_dict() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.as_dict()})"
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def keys(self):
+        return self.__slots__
+
+    def update(self, values):
+        for key, value in values.items():
+            self[key] = value
+
+    def copy(self):
+        clone = type(self).__new__(type(self))
+        for key in self.__slots__:
+            setattr(clone, key, getattr(self, key))
+        return clone
+
+    def as_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+class FaberStatus(_SlotRecord):
+    """Latest telemetry (0x1030) of one fireplace."""
+
+    __slots__ = ("state", "flame_height", "flame_width", "temp")
+
+    def __init__(self):
+        self.state = 0
+        self.flame_height = 0
+        self.flame_width = 0
+        self.temp = 0.0
+
+class FaberDeviceInfo(_SlotRecord):
+    """Device (0x1010) and installer (0x0410) info of one fireplace."""
+
+    __slots__ = (
+        "model",
+        "manufacturer",
+        "serial",
+        "article",
+        "variant",
+        "installer_name",
+        "installer_phone",
+        "installer_web",
+        "installer_mail",
+    )
+
+    def __init__(self):
+        self.model = DEFAULT_MODEL
+        self.manufacturer = DEFAULT_MANUFACTURER
+        self.serial = None
+        self.article = None
+        self.variant = None
+        self.installer_name = None
+        self.installer_phone = None
+        self.installer_web = None
+        self.installer_mail = None
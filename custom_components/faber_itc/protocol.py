@@ -0,0 +1,221 @@
+"""Declarative description of the Faber ITC wire formats.
+
+The layouts below are the single source for field offsets and endianness.
+Decoders and encoders are compiled from them at import time, and
+faber_itc_codegen.py renders the same schema into the Wireshark dissector.
+"""
+import struct
+
+from .const import (
+    OP_IDENTIFY,
+    OP_INFO_410,
+    OP_INFO_420,
+    OP_INFO_1010,
+    OP_STATUS,
+    OP_CONTROL,
+    OP_HEARTBEAT,
+    MAGIC_START,
+    MAGIC_END,
+    UDP_MAGIC_START,
+    UDP_MAGIC_END,
+)
+
+# TCP frame: Magic Start (4) | Header (4) | Sender-ID (4) | Opcode (4) | Payload | Magic End (4)
+FRAME_HEADER_SIZE = 16
+FRAME_MIN_SIZE = FRAME_HEADER_SIZE + 4
+
+# Default payload schema: Reserved/Session (8) | Length (1) | Data (Length)
+PAYLOAD_DATA_OFFSET = 9
+PAYLOAD_LENGTH_OFFSET = 8
+
+# Largest frame the length byte can announce
+MAX_FRAME_SIZE = FRAME_HEADER_SIZE + PAYLOAD_DATA_OFFSET + 0xFF + 4
+
+OPCODE_NAMES = {
+    OP_IDENTIFY: "Identify/Handshake",
+    OP_INFO_410: "Installer Info",
+    OP_INFO_420: "Info 0420",
+    OP_INFO_1010: "Device Info",
+    OP_STATUS: "Telemetry",
+    OP_CONTROL: "Control",
+    OP_HEARTBEAT: "Heartbeat",
+}
+
+class Field:
+    """A fixed-offset field inside a layout.
+
+    kind is "uint" (big or little endian), "bytes" or "const" (fixed bytes,
+    written by encoders and skipped by decoders).
+    """
+
+    __slots__ = ("name", "offset", "size", "kind", "little_endian", "value")
+
+    def __init__(self, name, offset, size, kind="uint", little_endian=False, value=None):
+        self.name = name
+        self.offset = offset
+        self.size = size
+        self.kind = kind
+        self.little_endian = little_endian
+        self.value = value
+
+_UINT_FORMATS = {1: "B", 2: "H", 4: "I"}
+
+class Layout:
+    """A message layout with compiled decode/encode functions.
+
+    decode(buffer, offset=0) returns a tuple of the non-constant fields in
+    declaration order, encode(*values) builds the bytes for the same fields.
+    """
+
+    def __init__(self, name, opcode, fields):
+        self.name = name
+        self.opcode = opcode
+        self.fields = tuple(fields)
+        self.size = max(f.offset + f.size for f in self.fields)
+        self.names = tuple(f.name for f in self.fields if f.kind != "const")
+        self.decode, self.encode = _compile(self)
+
+def _compile(layout):
+    """Generate straight-line decoder and encoder functions for a layout."""
+    namespace = {"bytearray": bytearray, "bytes": bytes}
+    reads, writes = [], []
+    for f in layout.fields:
+        if f.kind == "const":
+            namespace[f"c_{f.name}"] = f.value
+            writes.append(f"    buf[{f.offset}:{f.offset + f.size}] = c_{f.name}")
+        elif f.kind == "bytes":
+            reads.append(f"b[o + {f.offset}:o + {f.offset + f.size}]")
+            writes.append(f"    buf[{f.offset}:{f.offset + f.size}] = {f.name}")
+        elif f.size == 1:
+            reads.append(f"b[o + {f.offset}]")
+            writes.append(f"    buf[{f.offset}] = {f.name}")
+        else:
+            codec = struct.Struct(("<" if f.little_endian else ">") + _UINT_FORMATS[f.size])
+            namespace[f"u_{f.name}"] = codec.unpack_from
+            namespace[f"p_{f.name}"] = codec.pack_into
+            reads.append(f"u_{f.name}(b, o + {f.offset})[0]")
+            writes.append(f"    p_{f.name}(buf, {f.offset}, {f.name})")
+
+    args = ", ".join(layout.names)
+    source = (
+        f"def decode(b, o=0):\n    return ({', '.join(reads)},)\n"
+        f"def encode({args}):\n    buf = bytearray({layout.size})\n"
+        + "\n".join(writes)
+        + "\n    return bytes(buf)\n"
+    )
+    exec(compile(source, f"<faber_itc layout {layout.name}>", "exec"), namespace)
+    return namespace["decode"], namespace["encode"]
+
+# Telemetry response (0x1030), offsets relative to the Data part of the payload
+TELEMETRY = Layout(
+    "telemetry",
+    OP_STATUS,
+    [
+        Field("state", 2, 1),
+        Field("flame_height", 6, 1),
+        Field("flame_width", 7, 1),
+        # Room temperature in 0.1 °C
+        Field("temp", 11, 2),
+    ],
+)
+
+# Control request (0x1040), fixed 9-byte payload without the default schema
+CONTROL = Layout(
+    "control",
+    OP_CONTROL,
+    [
+        Field("marker", 0, 2, kind="const", value=b"\xFF\xFF"),
+        Field("param_id", 2, 2),
+        Field("reserved", 4, 3, kind="const", value=b"\x00\x00\x00"),
+        Field("value", 7, 2, little_endian=True),
+    ],
+)
+
+# UDP discovery broadcast (48 bytes)
+DISCOVERY = Layout(
+    "discovery",
+    None,
+    [
+        Field("magic_start", 0, 8, kind="const", value=UDP_MAGIC_START),
+        Field("sender_id", 8, 4, kind="bytes"),
+        Field("controller_ip", 12, 4, kind="bytes"),
+        Field("sequence", 16, 4),
+        Field("name", 20, 24, kind="bytes"),
+        Field("magic_end", 44, 4, kind="const", value=UDP_MAGIC_END),
+    ],
+)
+
+LAYOUTS = (TELEMETRY, CONTROL, DISCOVERY)
+
+def split_frames(buffer, flush=False):
+    """Split the complete frames off a receive buffer.
+
+    Frames are delimited by the length byte of the default payload schema, so
+    MAGIC_END bytes inside a payload do not cut a frame short. Frames whose
+    length byte does not match (e.g. control echoes) fall back to searching for
+    MAGIC_END. A frame announcing more data than the buffer holds is waited
+    for, unless flush is set (the stream went idle) and the buffer ends in
+    MAGIC_END, in which case the rest is delivered as one frame. Returns
+    (frames, rest, skipped) where rest must be kept for the next call and
+    skipped counts garbage bytes dropped while resynchronising.
+    """
+    frames = []
+    skipped = 0
+    pos = 0
+    size = len(buffer)
+    while True:
+        start = buffer.find(MAGIC_START, pos)
+        if start == -1:
+            # Keep a possible partial MAGIC_START at the end
+            keep = max(pos, size - len(MAGIC_START) + 1)
+            return frames, buffer[keep:], skipped + keep - pos
+        skipped += start - pos
+
+        length_pos = start + FRAME_HEADER_SIZE + PAYLOAD_LENGTH_OFFSET
+        if length_pos >= size:
+            return frames, buffer[start:], skipped
+
+        end = length_pos + 1 + buffer[length_pos]
+        if end + len(MAGIC_END) > size:
+            if flush and buffer.endswith(MAGIC_END):
+                # Nothing followed, so the length byte overstates the data
+                frames.append(buffer[start:])
+                return frames, b"", skipped
+            # Wait for the announced length
+            return frames, buffer[start:], skipped
+        if buffer[end:end + len(MAGIC_END)] != MAGIC_END:
+            # Bounded search keeps a flood of start markers linear
+            end = buffer.find(
+                MAGIC_END, start + FRAME_HEADER_SIZE, start + MAX_FRAME_SIZE
+            )
+            if end == -1 and size - start < MAX_FRAME_SIZE:
+                return frames, buffer[start:], skipped
+            if end == -1 or end + len(MAGIC_END) - start > MAX_FRAME_SIZE:
+                # No plausible end for this start marker, resync on the next one
+                pos = start + 1
+                skipped += 1
+                continue
+
+        pos = end + len(MAGIC_END)
+        frames.append(buffer[start:pos])
+
+def render_lua():
+    """Render the schema as a Lua table for the Wireshark dissector."""
+    lines = ["local SCHEMA = {"]
+    for layout in LAYOUTS:
+        lines.append(f"  {layout.name} = {{")
+        lines.append(f"    size = {layout.size},")
+        for f in layout.fields:
+            le = "true" if f.little_endian else "false"
+            lines.append(
+                f"    {f.name} = {{ offset = {f.offset}, size = {f.size}, le = {le} }},"
+            )
+        lines.append("  },")
+    lines.append("}")
+    lines.append("")
+    lines.append("local OPCODE_NAMES = {")
+    for opcode, name in sorted(OPCODE_NAMES.items()):
+        lines.append(f'  [0x{opcode:04X}] = "{name}",')
+    lines.append("}")
+    lines.append(f"local PAYLOAD_DATA_OFFSET = {PAYLOAD_DATA_OFFSET}")
+    return "\n".join(lines)
@@ -4,11 +4,11 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .const import DOMAIN, CONF_SENDER_ID
+from .const import DOMAIN, CONF_SENDER_ID, STATE_NAMES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,22 +18,23 @@ async def async_setup_entry(hass, entry, async_add_entities):
     async_add_entities([
         FaberTemperatureSensor(coordinator, entry),
         FaberInstallerSensor(coordinator, entry),
+        FaberStatusSensor(coordinator, entry),
+        FaberBurnTimeSensor(coordinator, entry),
+        FaberIgnitionCountSensor(coordinator, entry),
+        FaberIgnitionTimeSensor(coordinator, entry),
     ])
 
-class FaberTemperatureSensor(CoordinatorEntity, SensorEntity):
-    """Representation of the Faber Fireplace room temperature."""
+class FaberBaseSensor(CoordinatorEntity, SensorEntity):
+    """Base class for Faber sensors."""
 
     _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
 
-    def __init__(self, coordinator, entry):
+    def __init__(self, coordinator, entry, key):
         super().__init__(coordinator)
         self._entry = entry
         # Use a stable unique_id based on entry_id to prevent recorder issues
-        self._attr_unique_id = f"{entry.entry_id}_temperature"
-        self._attr_translation_key = "temperature"
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_translation_key = key
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -63,6 +64,16 @@ class FaberTemperatureSensor(CoordinatorEntity, SensorEntity):
             serial_number=info.get("serial"),
         )
 
+class FaberTemperatureSensor(FaberBaseSensor):
+    """Representation of the Faber Fireplace room temperature."""
+
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry, "temperature")
+
     @property
     def native_value(self):
         """Return the current temperature."""
@@ -70,43 +81,13 @@ class FaberTemperatureSensor(CoordinatorEntity, SensorEntity):
             return None
         return self.coordinator.data.get("temp")
 
-class FaberInstallerSensor(CoordinatorEntity, SensorEntity):
+class FaberInstallerSensor(FaberBaseSensor):
     """Representation of the Faber Installer info."""
 
-    _attr_has_entity_name = True
     _attr_icon = "mdi:account-wrench"
 
     def __init__(self, coordinator, entry):
-        super().__init__(coordinator)
-        self._entry = entry
-        self._attr_unique_id = f"{entry.entry_id}_installer"
-        self._attr_translation_key = "installer"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        info = self.coordinator.client.device_info
-        model_name = info.get("model")
-        if not model_name or model_name == "Faber ITC Fireplace":
-            model_name = self._entry.data.get("name") or "Faber ITC Fireplace"
-            
-        sender_id = self._entry.data.get(CONF_SENDER_ID)
-        
-        identifiers = {(DOMAIN, self._entry.entry_id)}
-        connections = set()
-        if sender_id:
-            identifiers.add((DOMAIN, sender_id))
-            formatted_mac = ":".join(sender_id[i:i+2] for i in range(0, len(sender_id), 2))
-            connections.add((dr.CONNECTION_NETWORK_MAC, formatted_mac))
-
-        return DeviceInfo(
-            identifiers=identifiers,
-            connections=connections,
-            name=model_name,
-            manufacturer=info.get("manufacturer", "Faber"),
-            model=model_name,
-            serial_number=info.get("serial"),
-        )
+        super().__init__(coordinator, entry, "installer")
 
     @property
     def native_value(self):
@@ -124,3 +105,97 @@ class FaberInstallerSensor(CoordinatorEntity, SensorEntity):
             "article_no": info.get("article"),
             "variant": info.get("variant"),
         }
+
+class FaberStatusSensor(FaberBaseSensor):
+    """Representation of the fireplace operating state incl. transitions."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = list(STATE_NAMES.values())
+    _attr_icon = "mdi:fireplace"
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry, "status")
+
+    @property
+    def native_value(self):
+        """Return the operating state."""
+        if not self.coordinator.data:
+            return None
+        return STATE_NAMES.get(self.coordinator.data.get("state"))
+
+    @property
+    def extra_state_attributes(self):
+        """Return the duration of the last ignition."""
+        return {
+            "ignition_duration": self.coordinator.client.ignition_duration,
+        }
+
+class FaberStatisticsSensor(FaberBaseSensor):
+    """Base class for sensors backed by the in-memory telemetry history."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator, entry, key):
+        super().__init__(coordinator, entry, key)
+        self._history = coordinator.client.history
+
+class FaberBurnTimeSensor(FaberStatisticsSensor):
+    """Burn time since startup, split by flame level and burner width."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_suggested_display_precision = 2
+    _attr_icon = "mdi:fire-circle"
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry, "burn_time")
+
+    @property
+    def native_value(self):
+        """Return the total burn time."""
+        return round(self._history.burn_hours, 3)
+
+    @property
+    def extra_state_attributes(self):
+        """Return burn time per flame level and burner width."""
+        stats = self._history.statistics()
+        return {**stats["burn_hours_by_level"], **stats["burn_hours_by_width"]}
+
+class FaberIgnitionCountSensor(FaberStatisticsSensor):
+    """Number of ignitions since startup."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:counter"
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry, "ignitions")
+
+    @property
+    def native_value(self):
+        """Return the number of ignitions."""
+        return self._history.ignition_count
+
+    @property
+    def extra_state_attributes(self):
+        """Return successful and failed ignitions."""
+        return {
+            "successful": self._history.ignition_successes,
+            "failed": self._history.ignition_failures,
+        }
+
+class FaberIgnitionTimeSensor(FaberStatisticsSensor):
+    """Average duration of successful ignitions."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator, entry, "average_ignition_time")
+
+    @property
+    def native_value(self):
+        """Return the average ignition time."""
+        return self._history.average_ignition_time
@@ -8,6 +8,8 @@ from .const import (
     CONF_SENDER_ID,
     INTENSITY_LEVELS,
     STATE_OFF,
+    STATE_IGNITING,
+    STATE_SHUTTING_DOWN,
     WIDTH_WIDE,
     WIDTH_NARROW,
 )
@@ -67,6 +69,11 @@ class FaberBaseSwitch(CoordinatorEntity, SwitchEntity):
             serial_number=info.get("serial"),
         )
 
+    async def _async_set_state(self, **target):
+        """Apply a target state and resync if the device did not confirm it."""
+        if not await self._client.set_state(**target):
+            await self.coordinator.async_request_refresh()
+
 class FaberPowerSwitch(FaberBaseSwitch):
     """Main power switch for the fireplace."""
 
@@ -84,7 +91,9 @@ class FaberPowerSwitch(FaberBaseSwitch):
     def is_on(self):
         if not self.coordinator.data:
             return False
-        return self.coordinator.data.get("state", STATE_OFF) != STATE_OFF
+        # A shutdown in progress already counts as off, ignition as on
+        return self.coordinator.data.get("state", STATE_OFF) not in (STATE_OFF, STATE_SHUTTING_DOWN)
+
     @property
     def extra_state_attributes(self):
         """Return entity specific state attributes."""
@@ -93,14 +102,14 @@ class FaberPowerSwitch(FaberBaseSwitch):
         }
 
     async def async_turn_on(self, **kwargs):
-        self.coordinator.async_set_expected_state({"state": 1})
-        await self._client.turn_on()
-        await self.coordinator.async_request_refresh()
+        if not self.is_on:
+            self.coordinator.async_set_expected_state({"state": STATE_IGNITING})
+        await self._async_set_state(power=True)
 
     async def async_turn_off(self, **kwargs):
-        self.coordinator.async_set_expected_state({"state": 0})
-        await self._client.turn_off()
-        await self.coordinator.async_request_refresh()
+        if self.is_on:
+            self.coordinator.async_set_expected_state({"state": STATE_SHUTTING_DOWN})
+        await self._async_set_state(power=False)
 
 class FaberFlameLevelSwitch(FaberBaseSwitch):
     """Switch representing a specific flame level."""
@@ -127,7 +136,7 @@ class FaberFlameLevelSwitch(FaberBaseSwitch):
         if not self.coordinator.data:
             return False
 
-        is_fireplace_on = self.coordinator.data.get("state", STATE_OFF) != STATE_OFF
+        is_fireplace_on = self.coordinator.data.get("state", STATE_OFF) not in (STATE_OFF, STATE_SHUTTING_DOWN)
 
         # Pilot flame (level 0) is "on" whenever the fireplace is on
         if self._level == 0:
@@ -149,28 +158,19 @@ class FaberFlameLevelSwitch(FaberBaseSwitch):
         return self._level == closest_lvl
 
     async def async_turn_on(self, **kwargs):
-        # Ensure fireplace is on
-        if self.coordinator.data.get("state", STATE_OFF) == STATE_OFF:
-            self.coordinator.async_set_expected_state({"state": 1})
-            await self._client.turn_on()
-
+        # Ignition (if needed) and flame level are applied in one transaction
         protocol_value = INTENSITY_LEVELS.get(self._level, 0x00)
-        self.coordinator.async_set_expected_state({"flame_height": protocol_value})
-        await self._client.set_flame_height(protocol_value)
-        await self.coordinator.async_request_refresh()
+        expected = {"flame_height": protocol_value}
+        if self.coordinator.data.get("state", STATE_OFF) in (STATE_OFF, STATE_SHUTTING_DOWN):
+            expected["state"] = STATE_IGNITING
+        self.coordinator.async_set_expected_state(expected)
+        await self._async_set_state(power=True, flame_level=protocol_value)
 
     async def async_turn_off(self, **kwargs):
-        # Turning off pilot flame (level 0) just re-sends the command to stay on
-        if self._level == 0:
-            self.coordinator.async_set_expected_state({"flame_height": INTENSITY_LEVELS[0]})
-            await self._client.set_flame_height(INTENSITY_LEVELS[0])
-            await self.coordinator.async_request_refresh()
-            return
-
-        # Turning off levels 1-4 reverts to pilot flame (level 0)
+        # Turning off pilot flame (level 0) keeps it on,
+        # turning off levels 1-4 reverts to pilot flame (level 0)
         self.coordinator.async_set_expected_state({"flame_height": INTENSITY_LEVELS[0]})
-        await self._client.set_flame_height(INTENSITY_LEVELS[0])
-        await self.coordinator.async_request_refresh()
+        await self._async_set_state(flame_level=INTENSITY_LEVELS[0])
 
 class FaberBurnerModeSwitch(FaberBaseSwitch):
     """Switch representing burner width (Narrow/Wide)."""
@@ -193,12 +193,10 @@ class FaberBurnerModeSwitch(FaberBaseSwitch):
     async def async_turn_on(self, **kwargs):
         protocol_value = WIDTH_WIDE if self._wide else WIDTH_NARROW
         self.coordinator.async_set_expected_state({"flame_width": protocol_value})
-        await self._client.set_flame_width(self._wide)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_state(width=self._wide)
 
     async def async_turn_off(self, **kwargs):
-        # Turning off a burner mode just re-sends the command for the current mode
+        # Turning off a burner mode just keeps the current mode
         protocol_value = WIDTH_WIDE if self._wide else WIDTH_NARROW
         self.coordinator.async_set_expected_state({"flame_width": protocol_value})
-        await self._client.set_flame_width(self._wide)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_state(width=self._wide)
@@ -0,0 +1,50 @@
+"""Render the protocol schema into the Wireshark dissector.
+
+The field layouts live in custom_components/faber_itc/protocol.py. This
+script rewrites the generated block of faber_itc_dissector.lua from them:
+
+    python faber_itc_codegen.py          # update the dissector
+    python faber_itc_codegen.py --check  # fail if it is out of date
+"""
+import argparse
+import os
+import sys
+
+import faber_itc_loader
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DISSECTOR = os.path.join(ROOT, "faber_itc_dissector.lua")
+BEGIN = "-- BEGIN GENERATED SCHEMA\n"
+END = "-- END GENERATED SCHEMA\n"
+
+protocol = faber_itc_loader.load("protocol")
+
+def render(source):
+    """Return the dissector source with a freshly generated schema block."""
+    start = source.index(BEGIN) + len(BEGIN)
+    end = source.index(END, start)
+    return source[:start] + protocol.render_lua() + "\n" + source[end:]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only verify the dissector is up to date")
+    args = parser.parse_args()
+
+    with open(DISSECTOR, encoding="utf-8") as f:
+        current = f.read()
+    updated = render(current)
+
+    if args.check:
+        if updated != current:
+            print(f"{os.path.basename(DISSECTOR)} is out of date, run faber_itc_codegen.py")
+            return 1
+        return 0
+
+    if updated != current:
+        with open(DISSECTOR, "w", encoding="utf-8") as f:
+            f.write(updated)
+        print(f"Updated {os.path.basename(DISSECTOR)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -79,6 +79,58 @@ udpdisc.fields = { f_ud_magic1, f_ud_magic2, f_ud_sender, f_ud_ip, f_ud_seq32, f
 local MAGIC_START_BA = ByteArray.new("A1A2A3A4")
 local MAGIC_END_BA   = ByteArray.new("FAFBFCFD")
 
+-- ===== Schema =====
+-- Offsets and endianness are shared with the Python integration
+-- (custom_components/faber_itc/protocol.py). Regenerate with faber_itc_codegen.py.
+-- BEGIN GENERATED SCHEMA
+local SCHEMA = {
+  telemetry = {
+    size = 13,
+    state = { offset = 2, size = 1, le = false },
+    flame_height = { offset = 6, size = 1, le = false },
+    flame_width = { offset = 7, size = 1, le = false },
+    temp = { offset = 11, size = 2, le = false },
+  },
+  control = {
+    size = 9,
+    marker = { offset = 0, size = 2, le = false },
+    param_id = { offset = 2, size = 2, le = false },
+    reserved = { offset = 4, size = 3, le = false },
+    value = { offset = 7, size = 2, le = true },
+  },
+  discovery = {
+    size = 48,
+    magic_start = { offset = 0, size = 8, le = false },
+    sender_id = { offset = 8, size = 4, le = false },
+    controller_ip = { offset = 12, size = 4, le = false },
+    sequence = { offset = 16, size = 4, le = false },
+    name = { offset = 20, size = 24, le = false },
+    magic_end = { offset = 44, size = 4, le = false },
+  },
+}
+
+local OPCODE_NAMES = {
+  [0x0020] = "Identify/Handshake",
+  [0x0410] = "Installer Info",
+  [0x0420] = "Info 0420",
+  [0x1010] = "Device Info",
+  [0x1030] = "Telemetry",
+  [0x1040] = "Control",
+  [0x1080] = "Heartbeat",
+}
+local PAYLOAD_DATA_OFFSET = 9
+-- END GENERATED SCHEMA
+
+local function schema_range(range, f)
+  return range(f.offset, f.size)
+end
+
+local function schema_uint(range, f)
+  local r = range(f.offset, f.size)
+  if f.le then return r:le_uint() end
+  return r:uint()
+end
+
 -- ===== Helpers =====
 local function tvb_find_ba(tvb, ba, start_at)
   local plen = ba:len()
@@ -131,12 +183,7 @@ local function extract_null_terminated_ascii_strings(tvb_range, min_len)
 end
 
 local function opcode_type_name(base16)
-  if base16 == 0x0020 then return "Identify/Handshake" end
-  if base16 == 0x0410 or base16 == 0x1010 then return "Device Info" end
-  if base16 == 0x1030 then return "Telemetry" end
-  if base16 == 0x1040 then return "Control" end
-  if base16 == 0x1080 then return "Heartbeat" end
-  return "Unknown"
+  return OPCODE_NAMES[base16] or "Unknown"
 end
 
 local function status_name(v)
@@ -205,52 +252,53 @@ end
 local function decode_control(subtree, payload_range, data_range, is_resp)
   if is_resp then return end
 
+  local c = SCHEMA.control
+
   -- Prefer payload_range if it looks like FF FF .... .... .... .... ....
-  if payload_range and payload_range:len() == 9 then
-    local b0 = payload_range(0,1):uint()
-    local b1 = payload_range(1,1):uint()
-    if b0 == 0xFF and b1 == 0xFF then
+  if payload_range and payload_range:len() == c.size then
+    if schema_uint(payload_range, c.marker) == 0xFFFF then
       local t = subtree:add("Control (decoded)")
 
-      local param_id = payload_range(2,2):uint()      -- BE
-      local value_le = payload_range(7,2):le_uint()   -- LE
+      local param_id = schema_uint(payload_range, c.param_id)  -- BE
+      local value_le = schema_uint(payload_range, c.value)     -- LE
 
-      t:add(f_ctl_param, payload_range(2,2), param_id)
-      t:add(f_ctl_value, payload_range(7,2), value_le)
+      t:add(f_ctl_param, schema_range(payload_range, c.param_id), param_id)
+      t:add(f_ctl_value, schema_range(payload_range, c.value), value_le)
       t:add(f_ctl_name,  payload_range, control_name(param_id, value_le))
       return
     end
   end
 
   -- Fallback: older assumption (if some firmware uses normal schema)
-  if data_range and data_range:len() >= 9 then
+  if data_range and data_range:len() >= c.size then
     local t = subtree:add("Control (decoded) [fallback]")
 
-    local param_id = data_range(2,2):uint()
-    local value_le = data_range(7,2):le_uint()
+    local param_id = schema_uint(data_range, c.param_id)
+    local value_le = schema_uint(data_range, c.value)
 
-    t:add(f_ctl_param, data_range(2,2), param_id)
-    t:add(f_ctl_value, data_range(7,2), value_le)
+    t:add(f_ctl_param, schema_range(data_range, c.param_id), param_id)
+    t:add(f_ctl_value, schema_range(data_range, c.value), value_le)
     t:add(f_ctl_name,  data_range, control_name(param_id, value_le))
   end
 end
 
 local function decode_data(subtree, base16, is_resp, payload_range, data_range)
   -- Telemetry 1030 (response)
-  if base16 == 0x1030 and is_resp and data_range and data_range:len() >= 13 then
+  local tel = SCHEMA.telemetry
+  if base16 == 0x1030 and is_resp and data_range and data_range:len() >= tel.size then
     local t = subtree:add("Telemetry (decoded)")
 
-    local st = data_range(2,1):uint()
-    t:add(f_tel_status, data_range(2,1)):append_text(" (" .. status_name(st) .. ")")
+    local st = schema_uint(data_range, tel.state)
+    t:add(f_tel_status, schema_range(data_range, tel.state)):append_text(" (" .. status_name(st) .. ")")
 
-    local fh = data_range(6,1):uint()
-    t:add(f_tel_flame_h, data_range(6,1)):append_text(" (level " .. flame_height_name(fh) .. ")")
+    local fh = schema_uint(data_range, tel.flame_height)
+    t:add(f_tel_flame_h, schema_range(data_range, tel.flame_height)):append_text(" (level " .. flame_height_name(fh) .. ")")
 
-    local fw = data_range(7,1):uint()
-    t:add(f_tel_flame_w, data_range(7,1)):append_text(" (" .. flame_width_name(fw) .. ")")
+    local fw = schema_uint(data_range, tel.flame_width)
+    t:add(f_tel_flame_w, schema_range(data_range, tel.flame_width)):append_text(" (" .. flame_width_name(fw) .. ")")
 
-    local temp_raw = data_range(12,1):uint()
-    t:add(f_tel_temp_c, data_range(12,1), temp_raw / 10.0)
+    local temp_raw = schema_uint(data_range, tel.temp)
+    t:add(f_tel_temp_c, schema_range(data_range, tel.temp), temp_raw / 10.0)
     return
   end
 
@@ -314,19 +362,19 @@ function faber.dissector(tvb, pinfo, tree)
       subtree:add(f_payload, payload_range)
 
       -- Special case: Control request payload is fixed 9 bytes (no default schema)
-      if base16 == 0x1040 and (not is_resp) and payload_len == 9 then
+      if base16 == 0x1040 and (not is_resp) and payload_len == SCHEMA.control.size then
         decode_data(subtree, base16, is_resp, payload_range, nil)
       else
         -- Default schema parsing
-        if payload_len >= 9 then
-          subtree:add(f_reserved, tvb(start+16, 8))
-          local lenbyte = tvb(start+24, 1):uint()
-          subtree:add(f_lenbyte, tvb(start+24, 1))
+        if payload_len >= PAYLOAD_DATA_OFFSET then
+          subtree:add(f_reserved, tvb(start+16, PAYLOAD_DATA_OFFSET - 1))
+          local lenbyte = tvb(start+16+PAYLOAD_DATA_OFFSET-1, 1):uint()
+          subtree:add(f_lenbyte, tvb(start+16+PAYLOAD_DATA_OFFSET-1, 1))
 
-          local data_len = payload_len - 9
+          local data_len = payload_len - PAYLOAD_DATA_OFFSET
           local data_range = nil
           if data_len > 0 then
-            data_range = tvb(start+25, data_len)
+            data_range = tvb(start+16+PAYLOAD_DATA_OFFSET, data_len)
             subtree:add(f_data, data_range)
 
             local ascii = bytes_to_ascii(data_range)
@@ -362,17 +410,18 @@ function udpdisc.dissector(tvb, pinfo, tree)
   local pktlen = tvb:len()
   if pktlen < 28 then return 0 end
 
+  local d = SCHEMA.discovery
   local t = tree:add(udpdisc, tvb(), "Faber ITC Discovery")
 
-  t:add(f_ud_magic1,  tvb(0,4))
-  t:add(f_ud_magic2,  tvb(4,4))
-  t:add(f_ud_sender,  tvb(8,4))
-  t:add(f_ud_ip,      tvb(12,4))
-  t:add(f_ud_seq32,   tvb(16,4))
+  t:add(f_ud_magic1,  tvb(d.magic_start.offset, 4))
+  t:add(f_ud_magic2,  tvb(d.magic_start.offset + 4, 4))
+  t:add(f_ud_sender,  schema_range(tvb, d.sender_id))
+  t:add(f_ud_ip,      schema_range(tvb, d.controller_ip))
+  t:add(f_ud_seq32,   schema_range(tvb, d.sequence))
 
-  local name_range_len = pktlen - 24 -- start at 20, exclude trailing 4 bytes
+  local name_range_len = pktlen - d.name.offset - d.magic_end.size -- exclude trailing magic
   if name_range_len > 0 then
-    local name_range = tvb(20, name_range_len)
+    local name_range = tvb(d.name.offset, name_range_len)
     local name = bytes_to_ascii(name_range)
     if name ~= nil then
       t:add(f_ud_name, name_range, name)
@@ -382,7 +431,8 @@ function udpdisc.dissector(tvb, pinfo, tree)
   t:add(f_ud_magicend, tvb(pktlen-4, 4))
 
   pinfo.cols.protocol = "FABER-ITC"
-  pinfo.cols.info:append(string.format(" | DISC sender=%08X seq=%08X", tvb(8,4):uint(), tvb(16,4):uint()))
+  pinfo.cols.info:append(string.format(" | DISC sender=%08X seq=%08X",
+    schema_uint(tvb, d.sender_id), schema_uint(tvb, d.sequence)))
   return pktlen
 end
 
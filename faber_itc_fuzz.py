@@ -0,0 +1,259 @@
+"""Fuzz and adversarial-stream harness for the Faber ITC frame parser.
+
+Drives the client's framing (split_frames, _read_loop, _handle_frame) with
+randomly fragmented streams, payloads containing magic bytes, truncated and
+oversized frames and lying length bytes. It checks that valid frames are
+recovered unchanged and as soon as their last byte arrived (or once the stream
+went idle, for frames whose length byte overstates their data), that the
+receive buffer stays bounded and that parsing stays within a CPU budget per
+byte:
+
+    python faber_itc_fuzz.py                      # default run
+    python faber_itc_fuzz.py --iterations 5000 --seed 1 --budget-ns 2000
+
+Exits non-zero on the first failure. Only the client modules are loaded, so
+Home Assistant is not required.
+"""
+import argparse
+import asyncio
+import random
+import struct
+import sys
+import time
+
+import faber_itc_loader
+
+const = faber_itc_loader.load("const")
+protocol = faber_itc_loader.load("protocol")
+client_module = faber_itc_loader.load("client")
+
+OPCODES = [
+    const.OP_IDENTIFY, const.OP_INFO_410, const.OP_INFO_420, const.OP_INFO_1010,
+    const.OP_STATUS, const.OP_CONTROL, const.OP_HEARTBEAT, 0x0777,
+]
+NASTY = [const.MAGIC_END, const.MAGIC_START, const.MAGIC_END[:2], const.MAGIC_START[:3]]
+
+class FuzzFailure(Exception):
+    """A property did not hold."""
+
+def random_data(rng, size):
+    """Random bytes with magic markers sprinkled in."""
+    data = bytearray(rng.randbytes(size))
+    for _ in range(rng.randint(0, 3)):
+        marker = rng.choice(NASTY)
+        if size >= len(marker):
+            pos = rng.randint(0, size - len(marker))
+            data[pos:pos + len(marker)] = marker
+    return bytes(data)
+
+def valid_frame(rng):
+    """A well-formed frame following the default payload schema."""
+    opcode = rng.choice(OPCODES) | rng.choice((0, 0x10000000))
+    if opcode & 0x0FFFFFFF == const.OP_STATUS and rng.random() < 0.5:
+        data = random_data(rng, 32)
+    else:
+        data = random_data(rng, rng.randint(0, 0xFF))
+    payload = rng.randbytes(8) + bytes([len(data)]) + data
+    return (
+        const.MAGIC_START + const.PROTO_HEADER + rng.randbytes(4)
+        + struct.pack(">I", opcode) + payload + const.MAGIC_END
+    )
+
+def clean_bytes(rng, size):
+    """Random bytes that cannot contain a magic marker."""
+    return bytes(rng.randrange(0xA0) for _ in range(size))
+
+def overstated_frame(rng):
+    """A complete frame whose length byte claims more data than it holds."""
+    data = clean_bytes(rng, rng.randint(0, 0xF0))
+    length = rng.randint(len(data) + 1, 0xFF)
+    payload = clean_bytes(rng, 8) + bytes([length]) + data
+    return (
+        const.MAGIC_START + const.PROTO_HEADER + clean_bytes(rng, 4)
+        + struct.pack(">I", const.OP_INFO_1010 | 0x10000000) + payload + const.MAGIC_END
+    )
+
+def junk(rng):
+    """Bytes that cannot form a frame, even when followed by padding."""
+    kind = rng.randrange(4)
+    if kind == 0:
+        frame = overstated_frame(rng)
+        return frame[:rng.randint(1, len(frame) - 1)]
+    if kind == 1:
+        return const.MAGIC_START + clean_bytes(rng, rng.randint(0, 40))
+    if kind == 2:
+        return const.MAGIC_END
+    return clean_bytes(rng, rng.randint(1, 64))
+
+def corrupt_frame(rng):
+    """A frame that is truncated, oversized or lies about its length."""
+    frame = bytearray(valid_frame(rng))
+    kind = rng.randrange(4)
+    if kind == 0:
+        return bytes(frame[:rng.randint(1, len(frame) - 1)])
+    if kind == 1:
+        frame[24] = rng.randrange(256)
+        return bytes(frame)
+    if kind == 2:
+        return bytes(frame[:-4]) + random_data(rng, rng.randint(300, 2000)) + const.MAGIC_END
+    return const.MAGIC_START + rng.randbytes(rng.randint(0, 40))
+
+def fragment(rng, stream):
+    """Cut a stream into random chunks."""
+    chunks, pos = [], 0
+    while pos < len(stream):
+        end = pos + rng.choice((1, 2, 3, 5, 17, 64, 512, 4096))
+        chunks.append(stream[pos:end])
+        pos = end
+    return chunks
+
+def feed(chunks):
+    """Run chunks through split_frames like the read loop does."""
+    frames, buffer, peak = [], b"", 0
+    for chunk in chunks:
+        found, buffer, _ = protocol.split_frames(buffer + chunk)
+        frames.extend(found)
+        peak = max(peak, len(buffer))
+    return frames, buffer, peak
+
+def check_clean_stream(rng):
+    expected = [valid_frame(rng) for _ in range(rng.randint(1, 20))]
+    garbage = lambda: rng.choice((b"", b"\x00" * rng.randint(1, 8), const.MAGIC_END))
+    parts = [part for frame in expected for part in (garbage(), frame)]
+    stream = b"".join(parts)
+    frames, rest, _ = feed(fragment(rng, stream))
+    if frames != expected:
+        raise FuzzFailure(f"clean stream: recovered {len(frames)} of {len(expected)} frames")
+    if rest:
+        raise FuzzFailure(f"clean stream: {len(rest)} bytes left over")
+
+def check_no_delay(rng):
+    """A complete frame must come out with its last byte, not with later traffic."""
+    for _ in range(10):
+        frame = valid_frame(rng)
+        buffer, found = b"", []
+        for chunk in fragment(rng, frame):
+            found, buffer, _ = protocol.split_frames(buffer + chunk)
+            if found and buffer:
+                raise FuzzFailure("no-delay: frame delivered before it was complete")
+        if found != [frame]:
+            raise FuzzFailure(f"no-delay: complete frame held back: {frame.hex()}")
+
+def check_adversarial_stream(rng):
+    parts = [corrupt_frame(rng) if rng.random() < 0.3 else valid_frame(rng) for _ in range(30)]
+    # A run of valid frames after enough padding must always be recovered
+    tail = [valid_frame(rng) for _ in range(3)]
+    parts += [b"\x00" * protocol.MAX_FRAME_SIZE] + tail
+    frames, _, peak = feed(fragment(rng, b"".join(parts)))
+    if peak > protocol.MAX_FRAME_SIZE + 4096:
+        raise FuzzFailure(f"adversarial stream: buffer grew to {peak} bytes")
+    if frames[-len(tail):] != tail:
+        raise FuzzFailure("adversarial stream: parser did not resynchronise")
+    return frames
+
+class RecordingClient(client_module.FaberITCClient):
+    """Client that records the frames its read loop hands over."""
+
+    def __init__(self):
+        super().__init__("fuzz")
+        self.received = []
+
+    def _handle_frame(self, data):
+        self.received.append(data)
+
+async def read_through_client(chunks, idle=0):
+    """Feed chunks through the client's read loop, return the frames it handled."""
+    client = RecordingClient()
+    reader = asyncio.StreamReader()
+    closed = asyncio.Event()
+
+    async def on_close():
+        closed.set()
+
+    task = asyncio.create_task(client._read_loop(reader, on_close))
+    for chunk in chunks:
+        reader.feed_data(chunk)
+        await asyncio.sleep(0)
+    await asyncio.sleep(idle)
+    reader.feed_eof()
+    await asyncio.wait_for(closed.wait(), 5)
+    await task
+    return client.received
+
+async def check_read_loop(rng):
+    """The read loop must hand over exactly the valid frames of an adversarial stream."""
+    expected, parts = [], []
+    for _ in range(20):
+        if rng.random() < 0.3:
+            # Padding keeps the junk from reaching into the next frame
+            parts += [junk(rng), b"\x00" * protocol.MAX_FRAME_SIZE]
+        else:
+            frame = valid_frame(rng)
+            expected.append(frame)
+            parts.append(frame)
+    received = await read_through_client(fragment(rng, b"".join(parts)))
+    if received != expected:
+        raise FuzzFailure(f"read loop: handled {len(received)} frames, expected {len(expected)}")
+
+async def check_idle_flush(rng):
+    """A frame overstating its length must come out once the stream went idle."""
+    frame = overstated_frame(rng)
+    idle = client_module.FRAME_IDLE_TIMEOUT * 1.5
+    received = await read_through_client(fragment(rng, frame), idle)
+    if received != [frame]:
+        raise FuzzFailure(f"idle flush: overstated frame not delivered: {frame.hex()}")
+
+def check_handle_frame(rng, frames):
+    """_handle_frame must never raise, whatever the frame looks like."""
+    client = client_module.FaberITCClient("fuzz")
+    for frame in frames + [corrupt_frame(rng) for _ in range(10)]:
+        try:
+            client._handle_frame(frame)
+        except Exception as err:
+            raise FuzzFailure(f"_handle_frame raised {err!r} for {frame.hex()}") from err
+
+def check_budget(rng, budget_ns):
+    """Parsing cost per byte must stay within budget, also for worst-case input."""
+    streams = {
+        "valid": b"".join(valid_frame(rng) for _ in range(2000)),
+        "start markers": const.MAGIC_START * 50000,
+        "garbage": rng.randbytes(200000),
+    }
+    for name, stream in streams.items():
+        chunks = fragment(rng, stream)
+        started = time.perf_counter_ns()
+        feed(chunks)
+        per_byte = (time.perf_counter_ns() - started) / len(stream)
+        print(f"  {name:14s}: {per_byte:7.1f} ns/byte")
+        if per_byte > budget_ns:
+            raise FuzzFailure(f"{name}: {per_byte:.0f} ns/byte exceeds budget of {budget_ns} ns")
+
+async def run(args):
+    rng = random.Random(args.seed)
+    for _ in range(args.iterations):
+        check_clean_stream(rng)
+        check_no_delay(rng)
+        frames = check_adversarial_stream(rng)
+        check_handle_frame(rng, frames)
+    for _ in range(max(1, args.iterations // 50)):
+        await check_read_loop(rng)
+    for _ in range(3):
+        await check_idle_flush(rng)
+    print(f"{args.iterations} iterations passed (seed {args.seed})")
+    check_budget(rng, args.budget_ns)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=int(time.time()))
+    parser.add_argument("--budget-ns", type=float, default=2000.0, help="max parse time per byte")
+    args = parser.parse_args()
+    try:
+        asyncio.run(run(args))
+    except FuzzFailure as err:
+        print(f"FAILED (seed {args.seed}): {err}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""Import integration modules for the tool scripts in this directory.
+
+Registers custom_components/faber_itc as a bare "faber_itc" package, so the
+protocol and client modules load without running the integration's
+__init__ (which needs Home Assistant).
+"""
+import importlib
+import os
+import sys
+import types
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "custom_components", "faber_itc")
+
+def load(name):
+    """Return the integration module with the given name, e.g. "client"."""
+    if "faber_itc" not in sys.modules:
+        package = types.ModuleType("faber_itc")
+        package.__path__ = [PACKAGE_DIR]
+        sys.modules["faber_itc"] = package
+    return importlib.import_module(f"faber_itc.{name}")
@@ -0,0 +1,173 @@
+"""Load test for the Faber ITC client.
+
+Opens many simulated controller sessions in one process and reports memory
+and event-loop lag, to size a host for large deployments:
+
+    python faber_itc_loadtest.py --clients 1000 --duration 60
+
+A local TCP server plays the ITC controller (identify, info, telemetry and
+heartbeat replies). RSS figures include the simulator side of each session.
+Only the client modules are loaded, so Home Assistant is not required.
+"""
+import argparse
+import asyncio
+import os
+import random
+import resource
+import struct
+import sys
+import time
+
+import faber_itc_loader
+
+const = faber_itc_loader.load("const")
+client_module = faber_itc_loader.load("client")
+admission = faber_itc_loader.load("admission")
+
+SERVER_ID = b"\xFA\xC4\x2C\xD8"
+RESPONSE_BIT = 0x10000000
+
+def _frame(opcode, data):
+    payload = b"\x00" * 8 + bytes([len(data)]) + data
+    return (
+        const.MAGIC_START
+        + const.PROTO_HEADER
+        + SERVER_ID
+        + struct.pack(">I", opcode | RESPONSE_BIT)
+        + payload
+        + const.MAGIC_END
+    )
+
+STATUS_DATA = bytes([0, 0, const.STATE_ON, 0, 0, 0, 0x32, const.WIDTH_WIDE, 0, 0, 0, 0x00, 0xF3]) + b"\x00" * 19
+REPLIES = {
+    const.OP_IDENTIFY: _frame(const.OP_IDENTIFY, b"\x00" * 4),
+    const.OP_INFO_1010: _frame(const.OP_INFO_1010, b"Simulated ITC\x00M0000000\x00FAM\x00"),
+    const.OP_INFO_410: _frame(const.OP_INFO_410, b"Installer\x00000\x00example.org\x00info@example.org\x00"),
+    const.OP_STATUS: _frame(const.OP_STATUS, STATUS_DATA),
+    const.OP_HEARTBEAT: _frame(const.OP_HEARTBEAT, b""),
+}
+
+async def _serve_session(reader, writer):
+    """Answer every request frame of one client session."""
+    buffer = b""
+    try:
+        while True:
+            chunk = await reader.read(4096)
+            if not chunk:
+                break
+            buffer += chunk
+            while True:
+                start = buffer.find(const.MAGIC_START)
+                end = buffer.find(const.MAGIC_END, start + 16) if start != -1 else -1
+                if end == -1:
+                    break
+                opcode = struct.unpack(">I", buffer[start + 12:start + 16])[0] & 0x0FFFFFFF
+                buffer = buffer[end + 4:]
+                reply = REPLIES.get(opcode)
+                if reply:
+                    writer.write(reply)
+            await writer.drain()
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        writer.close()
+
+def _rss_bytes():
+    """Return the current resident set size."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # ru_maxrss is the peak, in KiB on Linux and bytes on macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+
+def _raise_fd_limit(needed):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        target = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        if target < needed:
+            print(f"warning: open file limit is {target}, {needed} needed")
+
+async def _monitor_lag(samples, interval, stop):
+    """Measure how late the event loop wakes up a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(loop.time() - start - interval)
+
+async def _poll(client, interval, stop):
+    await asyncio.sleep(random.uniform(0, interval))
+    while not stop.is_set():
+        await client.update()
+        await asyncio.sleep(interval)
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+async def run(args):
+    _raise_fd_limit(args.clients * 3 + 64)
+    server = await asyncio.start_server(_serve_session, "127.0.0.1", 0, backlog=args.clients)
+    port = server.sockets[0].getsockname()[1]
+
+    rss_start = _rss_bytes()
+    gate = admission.FaberConnectionGate(limit=args.connect_limit) if args.connect_limit else None
+    clients = [
+        client_module.FaberITCClient("127.0.0.1", port, gate=gate)
+        for _ in range(args.clients)
+    ]
+
+    started = time.monotonic()
+    results = await asyncio.gather(*(client.connect() for client in clients))
+    connect_time = time.monotonic() - started
+    connected = sum(results)
+    await asyncio.gather(*(client.request_info() for client in clients))
+    rss_connected = _rss_bytes()
+
+    stop = asyncio.Event()
+    lag = []
+    tasks = [asyncio.create_task(_monitor_lag(lag, 0.05, stop))]
+    tasks += [asyncio.create_task(_poll(client, args.interval, stop)) for client in clients]
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    rss_end = _rss_bytes()
+
+    with_status = sum(1 for client in clients if client.last_status["state"] == const.STATE_ON)
+    await asyncio.gather(*(client.disconnect() for client in clients))
+    server.close()
+    await server.wait_closed()
+
+    per_client = (rss_end - rss_start) / max(connected, 1)
+    print(f"clients connected     : {connected}/{args.clients} in {connect_time:.2f}s")
+    if gate and gate.last_time_to_online is not None:
+        print(f"fleet time-to-online  : {gate.last_time_to_online:.2f}s (limit {args.connect_limit})")
+    print(f"clients with telemetry: {with_status}")
+    print(f"RSS start/connected/end: {rss_start / 2**20:.1f} / {rss_connected / 2**20:.1f} / {rss_end / 2**20:.1f} MiB")
+    print(f"RSS per session       : {per_client / 1024:.1f} KiB (client + simulator)")
+    print(
+        "loop lag p50/p99/max  : "
+        f"{_percentile(lag, 50) * 1000:.2f} / {_percentile(lag, 99) * 1000:.2f} / "
+        f"{(max(lag) if lag else 0) * 1000:.2f} ms"
+    )
+    if connected:
+        print(f"loop lag p99 per conn : {_percentile(lag, 99) * 1e6 / connected:.2f} us")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of steady-state polling")
+    parser.add_argument("--interval", type=float, default=10.0, help="poll interval per client")
+    parser.add_argument(
+        "--connect-limit", type=int, default=0,
+        help="route connects through the admission gate with this limit (0 = off)",
+    )
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()